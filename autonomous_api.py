@@ -388,6 +388,27 @@ def register_autonomous_routes(app):
         except Exception as e:
             return jsonify({"success": False, "error": str(e)})
     
+    @app.route("/api/healing/health")
+    def self_healing_health():
+        """Get cached resource and exchange health report."""
+        if not AUTONOMOUS_AVAILABLE:
+            return jsonify({
+                "success": False,
+                "error": "Self-healing engine not available"
+            })
+        
+        try:
+            healer = get_self_healing_engine()
+            
+            return jsonify({
+                "success": True,
+                "data": healer.get_health_report(
+                    detailed=request.args.get("detailed", "").lower() in ("1", "true")
+                )
+            })
+        except Exception as e:
+            return jsonify({"success": False, "error": str(e)})
+    
     @app.route("/api/healing/issues")
     def active_healing_issues():
         """Get active issues being handled by self-healing."""
@@ -7,8 +7,15 @@ Supports 100+ exchanges with unified API.
 
 import ccxt
 import os
+import sys
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Callable
+
+from retry_utils import get_rate_limiter, pooled_session
 
 
 class CCXTConnector:
@@ -17,7 +24,7 @@ class CCXTConnector:
     Supports Binance, Coinbase, Kraken, Bybit, KuCoin, and 100+ more.
     """
     
-    EXCHANGE_MAP = {
+    EXCHANGE_MAP = MappingProxyType({
         'binance': ccxt.binance,
         'coinbase': ccxt.coinbase,
         'kraken': ccxt.kraken,
@@ -26,7 +33,10 @@ class CCXTConnector:
         'okx': ccxt.okx,
         'gateio': ccxt.gateio,
         'bitget': ccxt.bitget,
-    }
+    })
+    
+    # Quote currencies tried, in order, when resolving a base symbol to a pair
+    QUOTE_PREFERENCE = ('USDT', 'USD', 'USDC')
     
     def __init__(self, exchange_id: str, api_key: Optional[str] = None, 
                  secret: Optional[str] = None, sandbox: bool = True):
@@ -56,7 +66,15 @@ class CCXTConnector:
             config['secret'] = secret
         
         self.exchange = exchange_class(config)
+        self.exchange.session = pooled_session()
+        # Market data only: fail fast instead of ccxt's 10s default
+        self.exchange.timeout = 3000
         self.name = self.exchange.name
+        self._pair_map: Dict[str, Optional[str]] = {}
+        # Capability is fixed per exchange class - look it up once
+        self._batch_tickers = bool(self.exchange.has.get('fetchTickers'))
+        # Only used for exchanges without fetchTickers; created on first need
+        self._ticker_pool: Optional[ThreadPoolExecutor] = None
         
         print(f"[CCXT] Initialized {self.name}")
         print(f"  Sandbox: {sandbox}")
@@ -73,6 +91,7 @@ class CCXTConnector:
             Normalized price data or None on error
         """
         try:
+            get_rate_limiter(self.exchange_id).acquire()
             ticker = self.exchange.fetch_ticker(symbol)
             
             return {
@@ -90,6 +109,93 @@ class CCXTConnector:
             print(f"[CCXT:{self.name}] Error: {e}")
             return None
     
+    def fetch_prices(self, pairs: List[str]) -> Dict[str, float]:
+        """
+        Fetch last prices for several trading pairs in one request.
+        
+        Uses fetch_tickers when the exchange supports it, so N pairs cost
+        one round trip instead of N.
+        
+        Args:
+            pairs: Trading pairs (e.g., ["BTC/USDT", "ETH/USDT"])
+        
+        Returns:
+            Mapping of pair -> last price (pairs that failed are omitted)
+        """
+        if not pairs:
+            return {}
+        
+        limiter = get_rate_limiter(self.exchange_id)
+        if self._batch_tickers:
+            try:
+                limiter.acquire()
+                tickers = self.exchange.fetch_tickers(pairs)
+            except ccxt.BaseError as e:
+                print(f"[CCXT:{self.name}] Batch ticker error: {e}")
+                return {}
+        else:
+            def fetch(pair: str):
+                try:
+                    limiter.acquire()
+                    return pair, self.exchange.fetch_ticker(pair)
+                except ccxt.BaseError as e:
+                    print(f"[CCXT:{self.name}] Ticker error for {pair}: {e}")
+                    return pair, {}
+            
+            # No batch endpoint: overlap the per-pair round trips. The
+            # token bucket still paces request starts to the exchange limit.
+            if self._ticker_pool is None:
+                self._ticker_pool = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix=f"ccxt-{self.exchange_id}"
+                )
+            tickers = dict(self._ticker_pool.map(fetch, pairs))
+        
+        wanted = set(pairs)
+        return {
+            pair: float(ticker['last'])
+            for pair, ticker in tickers.items()
+            if pair in wanted and ticker.get('last') is not None
+        }
+    
+    def close(self):
+        """Release the per-pair ticker pool, if one was started."""
+        if self._ticker_pool is not None:
+            self._ticker_pool.shutdown(wait=False)
+            self._ticker_pool = None
+    
+    def resolve_pair(self, base: str) -> Optional[str]:
+        """
+        Resolve a base currency to the pair this exchange actually lists.
+        
+        Checks the loaded markets once per base (preferring USDT, then USD,
+        then USDC) so scans never spend a request on a pair that does not
+        exist.
+        
+        Args:
+            base: Base currency (e.g., "BTC")
+        
+        Returns:
+            Trading pair such as "BTC/USDT", or None if none is listed
+        """
+        if base in self._pair_map:
+            return self._pair_map[base]
+        
+        try:
+            markets = self.exchange.load_markets()
+        except ccxt.BaseError as e:
+            # Don't cache: markets may load on the next attempt
+            print(f"[CCXT:{self.name}] Markets error: {e}")
+            return f"{base}/{self.QUOTE_PREFERENCE[0]}"
+        
+        pair = next(
+            (f"{base}/{quote}" for quote in self.QUOTE_PREFERENCE if f"{base}/{quote}" in markets),
+            None
+        )
+        if pair:
+            pair = sys.intern(pair)
+        self._pair_map[base] = pair
+        return pair
+    
     def fetch_order_book(self, symbol: str = "BTC/USDT", limit: int = 10) -> Optional[Dict]:
         """
         Fetch order book depth for realistic slippage calculation.
@@ -102,6 +208,7 @@ class CCXTConnector:
             Order book data or None on error
         """
         try:
+            get_rate_limiter(self.exchange_id).acquire()
             order_book = self.exchange.fetch_order_book(symbol, limit)
             return {
                 "exchange": self.name,
@@ -152,36 +259,157 @@ class CCXTConnector:
 class MultiExchangeCCXT:
     """Connect to multiple exchanges via CCXT."""
     
-    def __init__(self, exchanges: List[str], sandbox: bool = True):
+    def __init__(self, exchanges: List[str], sandbox: bool = True,
+                 price_feed=None, max_feed_age: float = 5.0):
         """
         Initialize multiple exchanges.
         
         Args:
             exchanges: List of exchange IDs
             sandbox: Use sandbox mode
+            price_feed: Optional connected WebSocketPriceFeed; fresh pushed
+                ticks are used in get_prices instead of REST polling
+            max_feed_age: Seconds before a pushed tick is considered stale
         """
         self.connectors = {}
+        self.price_feed = price_feed
+        self.max_feed_age = max_feed_age
+        # base symbol -> feed pair ("BTC" -> "BTC/USDT"), built once per symbol
+        self._feed_pairs: Dict[str, str] = {}
+        # Scanner state kept between scan_once() calls
+        self._last_prices: Dict[str, Dict[str, float]] = {}
+        self._stop = threading.Event()
         
         for ex_id in exchanges:
             try:
                 connector = CCXTConnector(ex_id, sandbox=sandbox)
-                self.connectors[ex_id] = connector
+                self.connectors[sys.intern(ex_id)] = connector
             except Exception as e:
                 print(f"[MultiCCXT] Failed to init {ex_id}: {e}")
         
         print(f"[MultiCCXT] Initialized {len(self.connectors)} exchanges")
+        
+        # Exchanges are queried concurrently so a scan costs the slowest
+        # venue's round trip rather than the sum of all of them
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, len(self.connectors)),
+            thread_name_prefix="ccxt"
+        )
     
     def fetch_all_prices(self, symbol: str = "BTC/USDT") -> List[Dict]:
         """Fetch prices from all connected exchanges."""
-        prices = []
+        print(f"[MultiCCXT] Fetching {symbol} from {', '.join(self.connectors)}...")
+        results = self._pool.map(
+            lambda connector: connector.fetch_price(symbol),
+            self.connectors.values()
+        )
+        return [data for data in results if data]
+    
+    def get_prices(self, symbols: List[str]) -> Dict[str, Dict[str, float]]:
+        """
+        Fetch last prices for many base symbols across all exchanges.
+        
+        Prices pushed by an attached WebSocketPriceFeed are used when
+        fresh. Everything else costs one batched request per exchange,
+        for pairs resolved against that exchange's markets.
+        
+        Args:
+            symbols: Base currencies (e.g., ["BTC", "ETH", "SOL"])
+        
+        Returns:
+            Mapping of symbol -> {exchange: price}
+        """
+        prices: Dict[str, Dict[str, float]] = {symbol: {} for symbol in symbols}
+        
+        def fetch(name: str, connector: CCXTConnector) -> Dict[str, float]:
+            found = self._streamed_prices(name, symbols)
+            pairs = {}
+            for symbol in symbols:
+                if symbol not in found:
+                    pair = connector.resolve_pair(symbol)
+                    if pair:
+                        pairs[symbol] = pair
+            if not pairs:
+                return found
+            
+            quoted = connector.fetch_prices(list(pairs.values()))
+            for symbol, pair in pairs.items():
+                found[symbol] = quoted.get(pair)
+            return found
         
-        for name, connector in self.connectors.items():
-            print(f"[MultiCCXT] Fetching from {name}...")
-            data = connector.fetch_price(symbol)
-            if data:
-                prices.append(data)
+        names = list(self.connectors)
+        for name, found in zip(names, self._pool.map(fetch, names, self.connectors.values())):
+            for symbol, price in found.items():
+                if price:
+                    prices[symbol][name] = price
         
         return prices
+    
+    def scan_once(self, symbols: List[str], epsilon: float = 0.0001) -> Dict[str, Dict[str, float]]:
+        """
+        Fetch prices and return only those that moved since the last scan.
+        
+        Args:
+            symbols: Base currencies to scan
+            epsilon: Minimum relative change for a price to count as moved
+        
+        Returns:
+            Mapping of symbol -> {exchange: price} for changed prices only
+        """
+        changed: Dict[str, Dict[str, float]] = {}
+        
+        for symbol, quotes in self.get_prices(symbols).items():
+            last = self._last_prices.setdefault(symbol, {})
+            for exchange, price in quotes.items():
+                previous = last.get(exchange)
+                if previous is None or abs(price - previous) / previous > epsilon:
+                    last[exchange] = price
+                    changed.setdefault(symbol, {})[exchange] = price
+        
+        return changed
+    
+    def run_forever(self, symbols: List[str],
+                    on_change: Callable[[Dict[str, Dict[str, float]]], None],
+                    interval: float = 1.0, epsilon: float = 0.0001):
+        """
+        Scan repeatedly, calling on_change with each non-empty delta.
+        
+        Connections, markets and previous prices persist across iterations.
+        Returns after stop() is called.
+        """
+        self._stop.clear()
+        while not self._stop.is_set():
+            changed = self.scan_once(symbols, epsilon)
+            if changed:
+                on_change(changed)
+            self._stop.wait(interval)
+    
+    def stop(self):
+        """Stop a running run_forever() loop; the instance stays usable."""
+        self._stop.set()
+    
+    def close(self):
+        """Stop scanning and release the worker pools. Don't reuse afterwards."""
+        self.stop()
+        self._pool.shutdown(wait=False)
+        for connector in self.connectors.values():
+            connector.close()
+    
+    def _streamed_prices(self, exchange: str, symbols: List[str]) -> Dict[str, float]:
+        """Return fresh pushed prices for an exchange from the attached feed."""
+        if self.price_feed is None:
+            return {}
+        
+        cutoff = time.time() - self.max_feed_age
+        found = {}
+        for symbol in symbols:
+            pair = self._feed_pairs.get(symbol)
+            if pair is None:
+                pair = self._feed_pairs[symbol] = sys.intern(f"{symbol}/USDT")
+            tick = self.price_feed.get_price(pair, exchange)
+            if tick and tick.price > 0 and tick.timestamp >= cutoff:
+                found[symbol] = tick.price
+        return found
 
 
 if __name__ == "__main__":
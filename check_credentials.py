@@ -15,17 +15,32 @@ except ImportError:
     CRYPTO_AVAILABLE = False
     is_encrypted = lambda x: False
 
-def check_env():
-    """Load and check .env file"""
+try:
+    from dotenv import dotenv_values
+except ImportError:
+    dotenv_values = None
+
+def _parse_env(path='.env'):
+    """Parse a .env file (python-dotenv when available)"""
+    if not os.path.exists(path):
+        return {}
+    if dotenv_values is not None:
+        return {key: value or '' for key, value in dotenv_values(path).items()}
     env_vars = {}
-    if os.path.exists('.env'):
-        with open('.env') as f:
-            for line in f:
-                if '=' in line and not line.startswith('#'):
-                    key, value = line.strip().split('=', 1)
-                    env_vars[key] = value
+    with open(path) as f:
+        for line in f:
+            if '=' in line and not line.startswith('#'):
+                key, value = line.strip().split('=', 1)
+                env_vars[key] = value
     return env_vars
 
+# Parsed once at import; several report sections read it
+_ENV_VARS = _parse_env()
+
+def check_env():
+    """Load and check .env file"""
+    return dict(_ENV_VARS)
+
 def is_configured(value):
     """Check if a value is properly configured"""
     if not value:
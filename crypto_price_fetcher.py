@@ -17,6 +17,8 @@ from typing import Optional, Dict, Any, List
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from retry_utils import pooled_session
+
 try:
     from strategy_engine import StrategyEngine, ArbitrageStrategy
     STRATEGY_ENGINE_AVAILABLE = True
@@ -37,6 +39,8 @@ class ExchangeConnector:
     
     def __init__(self, name: str):
         self.name = name
+        # Keep-alive session so repeat fetches skip the DNS/TLS handshake
+        self.session = pooled_session()
     
     def fetch_price(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Fetch price for a symbol. Returns normalized data or None on error."""
@@ -65,7 +69,7 @@ class BinanceConnector(ExchangeConnector):
             endpoint = f"{self.API_BASE}/api/v3/ticker/24hr"
             params = {"symbol": symbol}
             
-            response = requests.get(endpoint, params=params, timeout=10)
+            response = self.session.get(endpoint, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
             
@@ -112,7 +116,7 @@ class CoinbaseConnector(ExchangeConnector):
             
             endpoint = f"{self.API_BASE}/products/{cb_symbol}/ticker"
             
-            response = requests.get(endpoint, timeout=10)
+            response = self.session.get(endpoint, timeout=10)
             response.raise_for_status()
             data = response.json()
             
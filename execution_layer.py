@@ -19,9 +19,11 @@ import hmac
 import base64
 import logging
 import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
 from datetime import datetime, timezone
 from decimal import Decimal, ROUND_DOWN
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Dict, Any, Optional, List, Callable
 from enum import Enum
 import random  # For simulating latency in paper mode
@@ -29,7 +31,7 @@ import random  # For simulating latency in paper mode
 # Import security and retry utilities
 try:
     from security_utils import sanitize_for_log, SecureLogger, generate_idempotency_key
-    from retry_utils import with_retry, CircuitBreaker, RETRY_NETWORK
+    from retry_utils import with_retry, CircuitBreaker, RetryConfig, RETRY_NETWORK, get_rate_limiter
     UTILS_AVAILABLE = True
 except ImportError:
     UTILS_AVAILABLE = False
@@ -94,6 +96,10 @@ class TradeExecution:
     fees_paid: Optional[float] = None
     net_pnl: Optional[float] = None
     error_message: Optional[str] = None
+    
+    def _to_dict(self) -> Dict[str, Any]:
+        """Shallow dict copy; fields are flat so asdict()'s deepcopy is wasted."""
+        return self.__dict__.copy()
 
 
 class ExecutionLayer:
@@ -107,6 +113,8 @@ class ExecutionLayer:
     - Comprehensive latency tracking
     """
     
+    MARKETS_REFRESH_SECONDS = 3600
+    
     def __init__(
         self,
         mode: ExecutionMode = ExecutionMode.PAPER,
@@ -115,7 +123,9 @@ class ExecutionLayer:
         binance_api_key: Optional[str] = None,
         binance_secret: Optional[str] = None,
         coinbase_api_key: Optional[str] = None,
-        coinbase_secret: Optional[str] = None
+        coinbase_secret: Optional[str] = None,
+        max_workers: int = 8,
+        simulate_latency: bool = True
     ):
         """
         Initialize Execution Layer.
@@ -128,10 +138,14 @@ class ExecutionLayer:
             binance_secret: Binance API secret (required for LIVE)
             coinbase_api_key: Coinbase API key (required for LIVE)
             coinbase_secret: Coinbase API secret (required for LIVE)
+            max_workers: Worker threads for background execution (submit_trade)
+            simulate_latency: Randomize paper latency/slippage and sleep per
+                trade. Disable for backtests to use fixed expected values.
         """
         self.mode = mode
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.simulate_latency = simulate_latency
         
         # API credentials (only used in LIVE mode)
         self.binance_api_key = binance_api_key
@@ -155,17 +169,85 @@ class ExecutionLayer:
         else:
             self.secure_logger = None
         
-        # Circuit breaker for live trading
-        self.circuit_breaker = CircuitBreaker(
-            failure_threshold=5,
-            recovery_timeout=60.0
-        ) if mode == ExecutionMode.LIVE else None
+        # Per-venue circuit breakers for live trading, so a flapping
+        # exchange only halts trades that route through it. HALF_OPEN
+        # admits a single probe order per recovery window.
+        self._breakers: Dict[str, CircuitBreaker] = {
+            venue: CircuitBreaker(
+                failure_threshold=5,
+                recovery_timeout=60.0,
+                half_open_max_calls=1
+            )
+            for venue in ("binance", "coinbase")
+        } if mode == ExecutionMode.LIVE else {}
         
         # Track executed orders for idempotency
         self.executed_orders = set()
         
+        # Background execution pool so retry backoff never blocks the caller.
+        # The bulkhead semaphore caps in-flight trades at the pool size so a
+        # burst of retrying orders cannot queue up behind each other.
+        self._exec_pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="exec"
+        )
+        self._bulkhead = threading.BoundedSemaphore(max_workers)
+        self._state_lock = threading.Lock()
+        
+        # Authenticated CCXT clients, built once so per-order work is just
+        # signing + send (client construction merges large describe() dicts)
+        self._ccxt = None
+        self.exchanges: Dict[str, Any] = {}
+        self._markets_timer: Optional[threading.Timer] = None
+        if mode == ExecutionMode.LIVE:
+            self._init_exchanges()
+            self._warm_markets()
+        
         self._log_init_info()
     
+    def _init_exchanges(self):
+        """Create authenticated CCXT clients for configured venues."""
+        try:
+            import ccxt
+        except ImportError:
+            logger.warning("[ExecutionLayer] CCXT not available")
+            return
+        self._ccxt = ccxt
+        
+        if self.binance_api_key:
+            self.exchanges["binance"] = ccxt.binance({
+                "apiKey": self.binance_api_key,
+                "secret": self.binance_secret,
+                "enableRateLimit": True,
+                "options": {"defaultType": "spot"}
+            })
+        if self.coinbase_api_key:
+            self.exchanges["coinbase"] = ccxt.coinbase({
+                "apiKey": self.coinbase_api_key,
+                "secret": self.coinbase_secret,
+                "enableRateLimit": True
+            })
+    
+    def _warm_markets(self, reload: bool = False):
+        """
+        Load market metadata up front and refresh it hourly.
+        
+        CCXT otherwise fetches exchangeInfo lazily inside the first
+        create_market_*_order call, stalling the session's first trade.
+        """
+        for name, exchange in self.exchanges.items():
+            try:
+                exchange.load_markets(reload=reload)
+            except Exception as e:
+                logger.warning(f"[ExecutionLayer] {name} load_markets failed: {e}")
+        
+        if self.exchanges:
+            self._markets_timer = threading.Timer(
+                self.MARKETS_REFRESH_SECONDS, self._warm_markets, kwargs={"reload": True}
+            )
+            self._markets_timer.daemon = True
+            self._markets_timer.start()
+    
     def _log_init_info(self):
         """Log initialization info securely."""
         log_msg = f"[ExecutionLayer] Initialized\n"
@@ -234,6 +316,64 @@ class ExecutionLayer:
         
         return has_binance or has_coinbase
     
+    def _tripped_venue(self, *venues: Optional[str]) -> Optional[str]:
+        """
+        Return the first venue whose circuit breaker blocks execution.
+        
+        Only peeks - no HALF_OPEN probe slot is claimed, so a trade that is
+        later rejected or unroutable can't burn a venue's only probe.
+        """
+        with self._state_lock:
+            for venue in venues:
+                name = (venue or "").lower()
+                breaker = self._breakers.get(name)
+                if breaker is not None and not breaker.would_execute():
+                    return name
+        return None
+    
+    def _claim_venues(self, *venues: Optional[str]) -> Optional[str]:
+        """
+        Claim a probe slot on every venue's breaker just before submission.
+        
+        Every venue is checked before any slot is claimed, under _state_lock
+        like the record_* paths, so two trades can't race for the same probe.
+        
+        Returns:
+            The first blocked venue (nothing claimed), or None once claimed
+        """
+        breakers = {}
+        for venue in venues:
+            name = (venue or "").lower()
+            if name in self._breakers:
+                breakers[name] = self._breakers[name]
+        
+        with self._state_lock:
+            for name, breaker in breakers.items():
+                if not breaker.would_execute():
+                    return name
+            for breaker in breakers.values():
+                breaker.can_execute()
+        return None
+    
+    def _release_venue(self, venue: Optional[str]):
+        """Return a claimed probe slot for a leg that was never sent."""
+        breaker = self._breakers.get((venue or "").lower())
+        if breaker is None:
+            return
+        with self._state_lock:
+            breaker.release_probe()
+    
+    def _record_venue_result(self, venue: Optional[str], success: bool):
+        """Record an order outcome against that venue's circuit breaker."""
+        breaker = self._breakers.get((venue or "").lower())
+        if breaker is None:
+            return
+        with self._state_lock:
+            if success:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+    
     def execute_trade(
         self,
         strategy_signal: Dict[str, Any],
@@ -338,9 +478,13 @@ class ExecutionLayer:
                 error_message=error_msg
             )
         
-        # Check circuit breaker
-        if self.circuit_breaker and not self.circuit_breaker.can_execute():
-            error_msg = f"Circuit breaker is {self.circuit_breaker.state} - trading halted"
+        # Check circuit breakers for both venues
+        tripped = self._tripped_venue(
+            strategy_signal.get("buy_exchange"),
+            strategy_signal.get("sell_exchange")
+        ) if strategy_signal.get("decision") == "TRADE" else None
+        if tripped:
+            error_msg = f"Circuit breaker for {tripped} is {self._breakers[tripped].state} - trading halted"
             print(f"🛑 {error_msg}")
             return TradeExecution(
                 trade_id=trade_id,
@@ -372,7 +516,10 @@ class ExecutionLayer:
         signal_latency_ms = (current_time - signal_timestamp) * 1000
         
         # Simulate/record risk check latency
-        risk_latency_ms = random.uniform(5, 20) if self.mode == ExecutionMode.PAPER else 10.0
+        if self.mode == ExecutionMode.PAPER and self.simulate_latency:
+            risk_latency_ms = random.uniform(5, 20)
+        else:
+            risk_latency_ms = 10.0
         
         execution_start = time.time()
         
@@ -472,20 +619,73 @@ class ExecutionLayer:
                 execution_start=execution_start
             )
         
-        self.executions.append(execution)
-        self._update_stats(execution)
+        with self._state_lock:
+            self.executions.append(execution)
+            self._update_stats(execution)
+            
+            # Track executed order for idempotency
+            self.executed_orders.add(trade_id)
         
-        # Track executed order for idempotency
-        self.executed_orders.add(trade_id)
+        return execution
+    
+    def submit_trade(
+        self,
+        strategy_signal: Dict[str, Any],
+        risk_result: Dict[str, Any],
+        signal_timestamp: float
+    ) -> "Future[TradeExecution]":
+        """
+        Execute a trade on the background pool.
         
-        # Update circuit breaker
-        if self.circuit_breaker:
-            if execution.status == OrderStatus.FILLED.value:
-                self.circuit_breaker.record_success()
-            elif execution.status == OrderStatus.FAILED.value:
-                self.circuit_breaker.record_failure()
+        Same arguments as execute_trade(), but returns immediately with a
+        Future so the caller's loop keeps ingesting market data while
+        order retries back off in a worker thread.
         
-        return execution
+        Returns:
+            Future resolving to the TradeExecution record
+        """
+        if not self._bulkhead.acquire(blocking=False):
+            future: Future = Future()
+            future.set_result(TradeExecution(
+                trade_id=f"TRADE_BUSY_{uuid.uuid4().hex[:8]}",
+                timestamp=datetime.now(timezone.utc).isoformat(),
+                mode=self.mode.value,
+                status=OrderStatus.REJECTED.value,
+                strategy_decision=strategy_signal.get("decision", "UNKNOWN"),
+                spread_pct=strategy_signal.get("spread_pct", 0),
+                risk_decision=risk_result.get("decision", "UNKNOWN"),
+                position_size_btc=0.0,
+                allocation_usd=0.0,
+                stop_loss_price=None,
+                buy_exchange=strategy_signal.get("buy_exchange", "N/A"),
+                sell_exchange=strategy_signal.get("sell_exchange", "N/A"),
+                buy_price=strategy_signal.get("buy_price", 0) or 0,
+                sell_price=strategy_signal.get("sell_price", 0) or 0,
+                quantity=0.0,
+                signal_latency_ms=0,
+                risk_latency_ms=0,
+                execution_latency_ms=0.0,
+                total_latency_ms=0.0,
+                error_message="Execution pool saturated - trade not submitted"
+            ))
+            return future
+        
+        future = self._exec_pool.submit(
+            self.execute_trade, strategy_signal, risk_result, signal_timestamp
+        )
+        future.add_done_callback(lambda _: self._bulkhead.release())
+        return future
+    
+    @staticmethod
+    def wait(future: "Future[TradeExecution]", timeout: Optional[float] = None) -> TradeExecution:
+        """Block until a submitted trade completes and return its record."""
+        return future.result(timeout=timeout)
+    
+    def shutdown(self, wait: bool = True):
+        """Stop the background execution pool and market refresh timer."""
+        if self._markets_timer:
+            self._markets_timer.cancel()
+        self._exec_pool.shutdown(wait=wait)
     
     def _execute_paper(
         self,
@@ -505,16 +705,20 @@ class ExecutionLayer:
     ) -> TradeExecution:
         """Execute a paper trade (simulation)."""
         
-        # Simulate execution latency (network + exchange processing)
-        simulated_latency = random.uniform(100, 500)  # 100-500ms
-        time.sleep(0.01)  # Tiny actual sleep for realism
+        if self.simulate_latency:
+            # Simulate execution latency (network + exchange processing)
+            simulated_latency = random.uniform(100, 500)  # 100-500ms
+            time.sleep(0.01)  # Tiny actual sleep for realism
+            slippage = random.uniform(-0.001, 0.001)  # ±0.1%
+        else:
+            # Backtest mode: expected values, no wall-clock delay
+            simulated_latency = 300.0
+            slippage = 0.0005
         
         execution_end = time.time()
         execution_latency_ms = (execution_end - execution_start) * 1000 + simulated_latency
         total_latency_ms = signal_latency_ms + risk_latency_ms + execution_latency_ms
         
-        # Simulate slippage
-        slippage = random.uniform(-0.001, 0.001)  # ±0.1%
         actual_buy = buy_price * (1 + abs(slippage))
         actual_sell = sell_price * (1 - abs(slippage))
         
@@ -605,44 +809,17 @@ class ExecutionLayer:
             total_latency_ms=0.0
         )
         
-        # Try to import ccxt
-        try:
-            import ccxt
-        except ImportError:
+        if self._ccxt is None:
             execution.status = OrderStatus.FAILED.value
             execution.error_message = "CCXT not installed. Run: pip install ccxt"
             return execution
         
-        # Initialize exchanges
+        ccxt = self._ccxt
         exchanges = {}
-        
-        if buy_exchange.lower() == "binance" and self.binance_api_key:
-            exchanges["buy"] = ccxt.binance({
-                "apiKey": self.binance_api_key,
-                "secret": self.binance_secret,
-                "enableRateLimit": True,
-                "options": {"defaultType": "spot"}
-            })
-        elif buy_exchange.lower() == "coinbase" and self.coinbase_api_key:
-            exchanges["buy"] = ccxt.coinbase({
-                "apiKey": self.coinbase_api_key,
-                "secret": self.coinbase_secret,
-                "enableRateLimit": True
-            })
-        
-        if sell_exchange.lower() == "binance" and self.binance_api_key:
-            exchanges["sell"] = ccxt.binance({
-                "apiKey": self.binance_api_key,
-                "secret": self.binance_secret,
-                "enableRateLimit": True,
-                "options": {"defaultType": "spot"}
-            })
-        elif sell_exchange.lower() == "coinbase" and self.coinbase_api_key:
-            exchanges["sell"] = ccxt.coinbase({
-                "apiKey": self.coinbase_api_key,
-                "secret": self.coinbase_secret,
-                "enableRateLimit": True
-            })
+        if buy_exchange.lower() in self.exchanges:
+            exchanges["buy"] = self.exchanges[buy_exchange.lower()]
+        if sell_exchange.lower() in self.exchanges:
+            exchanges["sell"] = self.exchanges[sell_exchange.lower()]
         
         # Check if we have the required exchanges
         if "buy" not in exchanges or "sell" not in exchanges:
@@ -659,6 +836,30 @@ class ExecutionLayer:
         actual_sell_price = None
         total_fees = 0.0
         
+        # Retry transient faults only (timeouts, 5xx, connection resets);
+        # exchange rejections such as InsufficientFunds fail fast.
+        if UTILS_AVAILABLE:
+            submit = with_retry(RetryConfig(
+                max_retries=self.max_retries,
+                base_delay=self.retry_delay,
+                max_delay=30.0,
+                retryable_exceptions=RETRY_NETWORK.retryable_exceptions + (ccxt.NetworkError,)
+            ))(self._submit_order)
+        else:
+            submit = self._submit_order
+        
+        # Claim breaker probes only now that both orders are about to go out
+        tripped = self._claim_venues(buy_exchange, sell_exchange)
+        if tripped:
+            execution.status = OrderStatus.FAILED.value
+            execution.error_message = f"Circuit breaker for {tripped} is {self._breakers[tripped].state} - trading halted"
+            print(f"\n❌ LIVE TRADE FAILED: {trade_id}")
+            print(f"   Error: {execution.error_message}")
+            return execution
+        
+        # Venue whose call is in flight, so failures hit the right breaker
+        leg_venue = buy_exchange
+        
         try:
             symbol = "BTC/USDT"
             
@@ -666,40 +867,28 @@ class ExecutionLayer:
             print(f"\n🔴 EXECUTING LIVE TRADE: {trade_id}")
             print(f"   BUY: {quantity:.6f} BTC on {buy_exchange}")
             
-            for attempt in range(self.max_retries):
-                try:
-                    buy_order = exchanges["buy"].create_market_buy_order(symbol, quantity)
-                    buy_order_id = buy_order.get("id", f"LIVE_BUY_{trade_id}")
-                    actual_buy_price = buy_order.get("price", buy_price)
-                    buy_fee = buy_order.get("fee", {}).get("cost", 0) or 0
-                    total_fees += buy_fee
-                    print(f"   ✅ BUY filled: {buy_order_id}")
-                    break
-                except Exception as e:
-                    print(f"   ⚠️  BUY attempt {attempt+1} failed: {e}")
-                    if attempt < self.max_retries - 1:
-                        time.sleep(self.retry_delay * (2 ** attempt))
-                    else:
-                        raise
+            buy_order_id, actual_buy_price, buy_fee = submit(
+                exchanges["buy"], "buy", symbol, quantity
+            )
+            self._record_venue_result(buy_exchange, True)
+            buy_order_id = buy_order_id or f"LIVE_BUY_{trade_id}"
+            actual_buy_price = actual_buy_price or buy_price
+            total_fees += buy_fee
+            print(f"   ✅ BUY filled: {buy_order_id}")
             
             # Place SELL order
             print(f"   SELL: {quantity:.6f} BTC on {sell_exchange}")
+            leg_venue = sell_exchange
             
-            for attempt in range(self.max_retries):
-                try:
-                    sell_order = exchanges["sell"].create_market_sell_order(symbol, quantity)
-                    sell_order_id = sell_order.get("id", f"LIVE_SELL_{trade_id}")
-                    actual_sell_price = sell_order.get("price", sell_price)
-                    sell_fee = sell_order.get("fee", {}).get("cost", 0) or 0
-                    total_fees += sell_fee
-                    print(f"   ✅ SELL filled: {sell_order_id}")
-                    break
-                except Exception as e:
-                    print(f"   ⚠️  SELL attempt {attempt+1} failed: {e}")
-                    if attempt < self.max_retries - 1:
-                        time.sleep(self.retry_delay * (2 ** attempt))
-                    else:
-                        raise
+            sell_order_id, actual_sell_price, sell_fee = submit(
+                exchanges["sell"], "sell", symbol, quantity
+            )
+            self._record_venue_result(sell_exchange, True)
+            leg_venue = None
+            sell_order_id = sell_order_id or f"LIVE_SELL_{trade_id}"
+            actual_sell_price = actual_sell_price or sell_price
+            total_fees += sell_fee
+            print(f"   ✅ SELL filled: {sell_order_id}")
             
             # Calculate results
             execution_end = time.time()
@@ -723,6 +912,10 @@ class ExecutionLayer:
             print(f"   ⏱️  Latency: {total_latency_ms:.1f}ms")
             
         except Exception as e:
+            self._record_venue_result(leg_venue, False)
+            if leg_venue == buy_exchange and sell_exchange.lower() != buy_exchange.lower():
+                # The sell leg was never sent - give its probe back
+                self._release_venue(sell_exchange)
             execution.status = OrderStatus.FAILED.value
             execution.error_message = str(e)
             execution.execution_latency_ms = (time.time() - execution_start) * 1000
@@ -730,6 +923,27 @@ class ExecutionLayer:
         
         return execution
     
+    def _submit_order(self, exchange, side: str, symbol: str, quantity: float):
+        """
+        Submit a single market order leg.
+        
+        Returns:
+            Tuple of (order_id, fill_price, fee_cost); id and price may be None
+        """
+        if UTILS_AVAILABLE:
+            get_rate_limiter(exchange.id).acquire()
+        try:
+            if side == "buy":
+                order = exchange.create_market_buy_order(symbol, quantity)
+            else:
+                order = exchange.create_market_sell_order(symbol, quantity)
+        except Exception as e:
+            print(f"   ⚠️  {side.upper()} attempt failed: {e}")
+            raise
+        
+        fee = (order.get("fee") or {}).get("cost", 0) or 0
+        return order.get("id"), order.get("price"), fee
+    
     def _update_stats(self, execution: TradeExecution):
         """Update execution statistics."""
         self.total_executions += 1
@@ -753,7 +967,7 @@ class ExecutionLayer:
             "failed": self.failed_executions,
             "success_rate": round(self.successful_executions / self.total_executions * 100, 2) if self.total_executions > 0 else 0,
             "avg_latency_ms": round(self.avg_latency_ms, 2),
-            "executions": [asdict(e) for e in self.executions[-10:]]  # Last 10
+            "executions": [e._to_dict() for e in self.executions[-10:]]  # Last 10
         }
     
     def print_summary(self):
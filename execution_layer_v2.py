@@ -23,21 +23,22 @@ import threading
 from datetime import datetime, timezone
 from decimal import Decimal, ROUND_DOWN
 from dataclasses import dataclass, asdict, field
-from typing import Dict, Any, Optional, List, Callable, Tuple
+from typing import Dict, Any, Optional, List, Callable, Tuple, NamedTuple
 from enum import Enum
 from collections import defaultdict
 import random
+from types import MappingProxyType
 
 # Import security and retry utilities
 try:
     from security_utils import sanitize_for_log, SecureLogger, generate_idempotency_key
-    from retry_utils import with_retry, CircuitBreaker, RETRY_NETWORK
+    from retry_utils import with_retry, CircuitBreaker, RETRY_NETWORK, get_rate_limiter, pooled_session
     UTILS_AVAILABLE = True
 except ImportError:
     UTILS_AVAILABLE = False
     print("[ExecutionLayerV2] Warning: security_utils/retry_utils not available")
 
-# Setup logger
+# Setup logger (launch_bot.setup_logging queues records off the order path)
 logger = logging.getLogger(__name__)
 
 
@@ -855,6 +856,8 @@ class ExecutionLayerV2:
                 # Determine remaining quantity to fill
                 remaining = leg.remaining_quantity if leg.remaining_quantity > 0 else quantity
                 
+                if UTILS_AVAILABLE:
+                    get_rate_limiter(getattr(exchange, "id", "default")).acquire()
                 if side == "buy":
                     order = exchange.create_market_buy_order(symbol, remaining)
                 else:
@@ -1070,34 +1073,116 @@ if __name__ == "__main__":
 # Live Trading Classes (merged from execution_layer_live.py)
 # =============================================================================
 
-class LiveExecutionResult:
-    """Result of a live trade execution"""
-    def __init__(self, success=False, order_id=None, filled_price=None,
-                 filled_amount=None, fee=None, error=None, timestamp=None,
-                 raw_response=None):
-        self.success = success
-        self.order_id = order_id
-        self.filled_price = filled_price
-        self.filled_amount = filled_amount
-        self.fee = fee
-        self.error = error
-        self.timestamp = timestamp or datetime.now(timezone.utc).isoformat()
-        self.raw_response = raw_response
+class _LiveExecutionFields(NamedTuple):
+    success: bool
+    order_id: Optional[str]
+    filled_price: Optional[float]
+    filled_amount: Optional[float]
+    fee: Optional[float]
+    error: Optional[str]
+    timestamp: int
+    raw_response: Optional[Dict[str, Any]]
+
+
+class LiveExecutionResult(_LiveExecutionFields):
+    """Result of a live trade execution (immutable; _asdict() to serialize)"""
+    __slots__ = ()
+
+    def __new__(cls, success=False, order_id=None, filled_price=None,
+                filled_amount=None, fee=None, error=None, timestamp=None,
+                raw_response=None):
+        # Nanoseconds since epoch; formatting is deferred to timestamp_iso
+        return super().__new__(cls, success, order_id, filled_price, filled_amount,
+                               fee, error, timestamp or time.time_ns(), raw_response)
+
+    @property
+    def timestamp_iso(self):
+        """Timestamp as an ISO-8601 UTC string for display."""
+        return datetime.fromtimestamp(self.timestamp / 1e9, tz=timezone.utc).isoformat()
+
+
+# Shared CCXT clients keyed by exchange name. Building a client and loading
+# its markets costs seconds, so every CEXTrader in the process reuses one.
+_EXCHANGE_CREDENTIALS = {
+    "binance": ("BINANCE_API_KEY", "BINANCE_SECRET"),
+    "coinbase": ("COINBASE_API_KEY", "COINBASE_SECRET"),
+    "kraken": ("KRAKEN_API_KEY", "KRAKEN_SECRET"),
+}
+_EXCHANGE_REGISTRY: Dict[str, Any] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_exchange(name: str):
+    """
+    Get the shared authenticated CCXT client for an exchange.
+    
+    Lazily constructs the client from environment credentials and loads
+    its markets once. Returns None if CCXT or credentials are missing.
+    """
+    name = name.lower()
+    ex = _EXCHANGE_REGISTRY.get(name)
+    if ex is not None:
+        return ex
+    
+    with _REGISTRY_LOCK:
+        if name in _EXCHANGE_REGISTRY:
+            return _EXCHANGE_REGISTRY[name]
+        
+        try:
+            import ccxt
+        except ImportError:
+            logger.warning("[CEXTrader] CCXT not available")
+            return None
+        
+        key_var, secret_var = _EXCHANGE_CREDENTIALS.get(name, (None, None))
+        key, secret = os.getenv(key_var or ""), os.getenv(secret_var or "")
+        if not (key and secret):
+            return None
+        
+        try:
+            kwargs = {"apiKey": key, "secret": secret, "enableRateLimit": True}
+            if name == "binance":
+                kwargs["options"] = {"defaultType": "spot"}
+            ex = getattr(ccxt, name)(kwargs)
+        except Exception as e:
+            logger.error(f"[CEXTrader] {name} init error: {e}")
+            return None
+        
+        if UTILS_AVAILABLE:
+            ex.session = pooled_session()
+        
+        try:
+            ex.load_markets()
+        except Exception as e:
+            logger.warning(f"[CEXTrader] {name} load_markets failed: {e}")
+        
+        _EXCHANGE_REGISTRY[name] = ex
+        logger.info(f"[CEXTrader] {name} initialized")
+        return ex
 
 
 class CEXTrader:
     """Centralized Exchange Trading via CCXT"""
 
-    EXCHANGE_MAP = {
+    EXCHANGE_MAP = MappingProxyType({
         "binance": "binance",
         "coinbase": "coinbase",
         "kraken": "kraken",
         "bybit": "bybit",
         "kucoin": "kucoin",
-    }
+    })
+
+    # Seconds a fetched ticker is reused before hitting the exchange again
+    TICKER_TTL = 0.5
 
     def __init__(self):
         self.exchanges = {}
+        self._ticker_cache: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        self._symbol_norm: Dict[Tuple[str, str], str] = {}
+        # Bound ccxt methods per exchange, saving attribute lookups per order
+        self._fetch_ticker: Dict[str, Callable] = {}
+        self._buy: Dict[str, Callable] = {}
+        self._sell: Dict[str, Callable] = {}
         self._ccxt_available = False
         try:
             import ccxt
@@ -1110,64 +1195,99 @@ class CEXTrader:
     def _init_exchanges(self):
         if not self._ccxt_available:
             return
-        ccxt = self._ccxt
-        pairs = [
-            ("binance", "BINANCE_API_KEY", "BINANCE_SECRET"),
-            ("coinbase", "COINBASE_API_KEY", "COINBASE_SECRET"),
-            ("kraken", "KRAKEN_API_KEY", "KRAKEN_SECRET"),
-        ]
-        for name, key_var, secret_var in pairs:
-            key, secret = os.getenv(key_var), os.getenv(secret_var)
-            if key and secret:
-                try:
-                    kwargs = {"apiKey": key, "secret": secret, "enableRateLimit": True}
-                    if name == "binance":
-                        kwargs["options"] = {"defaultType": "spot"}
-                    self.exchanges[name] = getattr(ccxt, name)(kwargs)
-                    logger.info(f"[CEXTrader] {name} initialized")
-                except Exception as e:
-                    logger.error(f"[CEXTrader] {name} init error: {e}")
+        for name in _EXCHANGE_CREDENTIALS:
+            ex = get_exchange(name)
+            if ex is not None:
+                self.exchanges[name] = ex
+                self._fetch_ticker[name] = ex.fetch_ticker
+                self._buy[name] = ex.create_market_buy_order
+                self._sell[name] = ex.create_market_sell_order
 
-    def execute_market_buy(self, exchange, symbol, amount_usd, dry_run=False):
+    @staticmethod
+    def _fail(error):
+        """Failed LiveExecutionResult carrying only the error message."""
+        return LiveExecutionResult(success=False, error=error)
+
+    def execute_market_buy(self, exchange, symbol, amount_usd, dry_run=False, reference_price=None):
         if not self._ccxt_available:
-            return LiveExecutionResult(success=False, error="CCXT not available")
-        ex = self.exchanges.get(exchange.lower())
+            return self._fail("CCXT not available")
+        name = exchange.lower()
+        ex = self.exchanges.get(name)
         if not ex:
-            return LiveExecutionResult(success=False, error=f"Exchange {exchange} not configured")
-        symbol = symbol.replace("-", "/").upper()
+            return self._fail(f"Exchange {exchange} not configured")
+        symbol = self._normalize_symbol(name, ex, symbol)
         if dry_run:
             return LiveExecutionResult(success=True, order_id="DRY_RUN", filled_amount=amount_usd, fee=0)
         try:
-            ticker = ex.fetch_ticker(symbol)
-            price = ticker["last"]
+            price = reference_price or self._cached_price(name, symbol)
             amount = amount_usd / price
-            order = ex.create_market_buy_order(symbol, amount)
+            self._throttle(name)
+            order = self._buy[name](symbol, amount)
             return LiveExecutionResult(
                 success=True, order_id=order.get("id"),
                 filled_price=order.get("average", order.get("price", price)),
                 filled_amount=order.get("filled", amount), fee=None, raw_response=order
             )
         except Exception as e:
-            return LiveExecutionResult(success=False, error=str(e))
+            return self._fail(str(e))
 
     def execute_market_sell(self, exchange, symbol, amount, dry_run=False):
         if not self._ccxt_available:
-            return LiveExecutionResult(success=False, error="CCXT not available")
-        ex = self.exchanges.get(exchange.lower())
+            return self._fail("CCXT not available")
+        name = exchange.lower()
+        ex = self.exchanges.get(name)
         if not ex:
-            return LiveExecutionResult(success=False, error=f"Exchange {exchange} not configured")
-        symbol = symbol.replace("-", "/").upper()
+            return self._fail(f"Exchange {exchange} not configured")
+        symbol = self._normalize_symbol(name, ex, symbol)
         if dry_run:
             return LiveExecutionResult(success=True, order_id="DRY_RUN", filled_amount=amount, fee=0)
         try:
-            order = ex.create_market_sell_order(symbol, amount)
+            self._throttle(name)
+            order = self._sell[name](symbol, amount)
             return LiveExecutionResult(
                 success=True, order_id=order.get("id"),
                 filled_price=order.get("average", order.get("price")),
                 filled_amount=order.get("filled", amount), fee=None, raw_response=order
             )
         except Exception as e:
-            return LiveExecutionResult(success=False, error=str(e))
+            return self._fail(str(e))
+
+    def _normalize_symbol(self, exchange, ex, symbol):
+        """
+        Map user input ("btc-usdt", "BTCUSDT") to the exchange's unified symbol.
+        
+        Resolved once per (exchange, input) against the preloaded markets,
+        then served from a dict.
+        """
+        key = (exchange, symbol)
+        resolved = self._symbol_norm.get(key)
+        if resolved is None:
+            resolved = symbol.replace("-", "/").upper()
+            by_id = getattr(ex, "markets_by_id", None) or {}
+            if resolved not in (ex.markets or {}) and resolved in by_id:
+                market = by_id[resolved]
+                # ccxt >= 2 stores a list of markets per id
+                resolved = (market[0] if isinstance(market, list) else market)["symbol"]
+            self._symbol_norm[key] = resolved
+        return resolved
+
+    @staticmethod
+    def _throttle(name):
+        """Wait for a request slot in the exchange's process-wide rate limiter."""
+        if UTILS_AVAILABLE:
+            get_rate_limiter(name).acquire()
+
+    def _cached_price(self, name, symbol):
+        """Last price from a ticker no older than TICKER_TTL seconds."""
+        key = (name, symbol)
+        cached = self._ticker_cache.get(key)
+        now = time.time()
+        if cached and now - cached[1] <= self.TICKER_TTL:
+            return cached[0]
+        self._throttle(name)
+        price = self._fetch_ticker[name](symbol)["last"]
+        self._ticker_cache[key] = (price, now)
+        return price
 
     def get_balance(self, exchange, currency="USDT"):
         if not self._ccxt_available:
@@ -1176,6 +1296,7 @@ class CEXTrader:
         if not ex:
             return 0.0
         try:
+            self._throttle(exchange)
             balance = ex.fetch_balance()
             return balance.get(currency, {}).get("free", 0.0)
         except Exception:
@@ -1217,12 +1338,30 @@ class LiveTradingExecutor:
         self.dex = DEXTrader()
         self.dry_run = os.getenv("DRY_RUN", "true").lower() == "true"
 
-    def execute_cex_arbitrage(self, buy_exchange, sell_exchange, symbol, amount_usd, expected_profit):
-        buy_result = self.cex.execute_market_buy(buy_exchange, symbol, amount_usd, dry_run=self.dry_run)
+    def execute_cex_arbitrage(self, buy_exchange, sell_exchange, symbol, amount_usd, expected_profit,
+                              buy_price=None):
+        # Both venues must be usable before any order goes out, or the buy
+        # leg would be left unhedged
+        if self.cex._ccxt_available:
+            for exchange in (buy_exchange, sell_exchange):
+                if exchange.lower() not in self.cex.exchanges:
+                    return False, {"error": f"Exchange {exchange} not configured"}
+
+        # Legs stay sequential: the sell is sized from the confirmed buy fill,
+        # so a failed or partial buy can never leave a naked short on the
+        # sell venue. A strategy-supplied buy_price skips the ticker fetch.
+        buy_result = self.cex.execute_market_buy(
+            buy_exchange, symbol, amount_usd, dry_run=self.dry_run, reference_price=buy_price
+        )
         if not buy_result.success:
             return False, {"error": f"Buy failed: {buy_result.error}"}
         amount_to_sell = buy_result.filled_amount or (amount_usd / (buy_result.filled_price or 1))
         sell_result = self.cex.execute_market_sell(sell_exchange, symbol, amount_to_sell, dry_run=self.dry_run)
+        logger.info(
+            "[LiveTradingExecutor] %s arbitrage %s->%s: buy=%s sell=%s",
+            symbol, buy_exchange, sell_exchange, buy_result.success, sell_result.success
+        )
+
         if not sell_result.success:
             return False, {"error": f"Sell failed: {sell_result.error}", "buy_order": buy_result}
         return True, {
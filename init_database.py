@@ -1,19 +1,43 @@
 #!/usr/bin/env python3
 """
 Initialize and fix trading database
+
+Usage: python init_database.py [--import-log]
 """
 
 import sqlite3
 import os
+import sys
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    import json
+    json_loads = json.loads
+
+INSERT_TRADE_SQL = """
+    INSERT OR IGNORE INTO trades
+    (trade_id, timestamp, symbol, side, exchange, entry_price, exit_price,
+     quantity, fees, net_pnl, status, mode, strategy)
+    VALUES (?, ?, ?, 'BUY', ?, ?, ?, ?, ?, ?, ?, ?, 'cex_arbitrage')
+"""
 
 def init_db():
     db_path = "trades.db"
     
     print(f"[DB] Initializing database: {db_path}")
     
+    is_new = not os.path.exists(db_path)
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
     
+    # page_size only applies before the first table is written
+    if is_new:
+        cursor.execute('PRAGMA page_size=8192')
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA cache_size=-20000')  # ~20 MB
+    
     # Main trades table
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS trades (
@@ -84,6 +108,9 @@ def init_db():
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_mode ON trades(mode)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_positions_status ON positions(status)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_prices_timestamp ON price_history(timestamp)')
+    # Composite indexes so per-mode history and open-position lookups are index-only
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_mode_ts ON trades(mode, timestamp DESC)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_positions_status_symbol ON positions(status, symbol)')
     
     conn.commit()
     conn.close()
@@ -99,5 +126,74 @@ def init_db():
     print(f"[DB] Existing tables: {[t[0] for t in tables]}")
     conn.close()
 
+def _trade_rows(lines, existing):
+    """Yield INSERT_TRADE_SQL parameter tuples for new filled trades in the log"""
+    for line in lines:
+        try:
+            entry = json_loads(line)
+        except ValueError:
+            continue
+        if not isinstance(entry, dict) or entry.get("type") != "TRADE_CYCLE":
+            continue
+        data = entry.get("data")
+        if not isinstance(data, dict):
+            continue
+        e = data.get("execution")
+        if not isinstance(e, dict) or e.get("status") != "FILLED":
+            continue
+        trade_id = e.get("trade_id")
+        if trade_id in existing:
+            continue
+        existing.add(trade_id)
+        
+        yield (
+            trade_id,
+            e.get("timestamp"),
+            data.get("symbol", "BTCUSDT"),
+            e.get("buy_exchange"),
+            e.get("buy_price"),
+            e.get("sell_price"),
+            e.get("quantity"),
+            e.get("fees_paid"),
+            e.get("net_pnl"),
+            e.get("status"),
+            e.get("mode", "PAPER")
+        )
+
+def import_from_log(log_file="trading_bot.log", db_path="trades.db"):
+    """Import filled trades from the bot's JSON-lines audit log into trades"""
+    if not os.path.exists(log_file):
+        print(f"[DB] Log file not found: {log_file}")
+        return 0
+    
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    cursor = conn.cursor()
+    # WAL + NORMAL sync: one fsync at checkpoint instead of per transaction
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("BEGIN IMMEDIATE")
+    
+    try:
+        # Re-runs over the same log are common; skip known trades before binding
+        existing = {row[0] for row in cursor.execute("SELECT trade_id FROM trades")}
+        
+        # Stream line by line (constant memory) through a 1 MiB read buffer;
+        # binary mode hands bytes straight to the parser - no decode pass.
+        # executemany pulls rows from the generator one at a time.
+        with open(log_file, "rb", buffering=1 << 20) as f:
+            cursor.executemany(INSERT_TRADE_SQL, _trade_rows(f, existing))
+        imported = max(cursor.rowcount, 0)
+        cursor.execute("COMMIT")
+    except Exception:
+        cursor.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+    
+    print(f"[DB] Imported {imported} trades from {log_file}")
+    return imported
+
 if __name__ == "__main__":
     init_db()
+    if "--import-log" in sys.argv:
+        import_from_log()
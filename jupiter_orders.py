@@ -5,17 +5,36 @@ Limit orders, DCA (Dollar Cost Averaging), and Perpetuals via Jupiter API
 Requires: pip install jupiter-python-sdk (or use raw API)
 """
 
-import requests
-import base64
+import logging
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    import json
+    json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
 # Jupiter API V1 (Updated 2026 - V6 deprecated)
 JUPITER_API = "https://api.jup.ag/swap/v1"
+JUPITER_TRIGGER_API = "https://api.jup.ag/trigger/v1"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LimitOrder:
     """Jupiter limit order details."""
     id: str
@@ -27,7 +46,7 @@ class LimitOrder:
     created_at: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DCAOrder:
     """Jupiter DCA (Dollar Cost Average) order."""
     id: str
@@ -49,8 +68,16 @@ class JupiterOrders:
     - DCA orders (recurring buys)
     - Cancel orders
     - Order status tracking
+    
+    Transport is HTTPS over one keep-alive session (HTTP/2 when httpx is
+    available, otherwise a pooled requests.Session). Jupiter's
+    Trigger and Recurring APIs are REST-only (no WebSocket order entry),
+    so connection reuse is what keeps per-order latency down.
     """
     
+    # Open-order state changes on the order of seconds - don't re-poll faster
+    ORDERS_CACHE_TTL = 5.0
+    
     def __init__(self, api_key: Optional[str] = None):
         """Initialize Jupiter Orders API."""
         self.api_key = api_key
@@ -58,7 +85,61 @@ class JupiterOrders:
         if api_key:
             self.headers["Authorization"] = f"Bearer {api_key}"
         
-        print("[JupiterOrders] Initialized")
+        # Shared client-side limiter so bursts don't trip Jupiter's 429s
+        # (imported here: retry_utils pulls in requests)
+        from retry_utils import get_rate_limiter
+        self._limiter = get_rate_limiter("jupiter")
+        
+        # Order submissions are network-bound; overlap them on a small pool
+        self._pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="jup-order")
+        
+        # Per-instance sequence so ids stay unique within the same nanosecond
+        self._seq = itertools.count()
+        
+        # wallet_address -> (monotonic ts, open orders)
+        self._orders_cache: Dict[str, tuple] = {}
+        
+        logger.info("[JupiterOrders] Initialized")
+    
+    @cached_property
+    def session(self):
+        """One keep-alive session for every Jupiter call, built on first use.
+
+        Prefers an HTTP/2 httpx client (pip install 'httpx[http2]') so the
+        concurrent order calls multiplex over a single TLS connection; falls
+        back to a pooled requests.Session. Both are imported lazily so
+        modules that only want LimitOrder / DCAOrder don't pay for them.
+        """
+        try:
+            import httpx
+            # Raises ImportError here if the h2 extra isn't installed
+            return httpx.Client(
+                http2=True,
+                headers=self.headers,
+                timeout=httpx.Timeout(10.0, connect=3.0),
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16,
+                                    keepalive_expiry=60),
+            )
+        except ImportError:
+            pass
+        
+        from retry_utils import pooled_session
+        session = pooled_session(pool_size=8)
+        session.headers.update(self.headers)
+        return session
+    
+    def close(self):
+        """Wait for in-flight submissions, then release the pool and session."""
+        self._pool.shutdown()
+        session = self.__dict__.pop("session", None)  # only if it was built
+        if session is not None:
+            session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
     
     def create_limit_order(
         self,
@@ -82,6 +163,8 @@ class JupiterOrders:
             LimitOrder object or None
         """
         try:
+            self._limiter.acquire()
+            
             # Note: Jupiter's Trigger API is used for limit orders
             # This is a simplified implementation
             
@@ -96,11 +179,13 @@ class JupiterOrders:
             
             # For now, simulate the order creation
             # Full implementation requires Jupiter Trigger API access
-            order_id = f"LIMIT_{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}"
+            order_id = f"LIMIT_{time.time_ns()}_{next(self._seq)}"
+            
+            logger.info("[JupiterOrders] Limit order created: %s", order_id)
+            logger.info("  Buy: %s... when price <= $%s", output_mint[:20], target_price)
+            logger.info("  Amount: %s of %s...", input_amount, input_mint[:20])
             
-            print(f"[JupiterOrders] Limit order created: {order_id}")
-            print(f"  Buy: {output_mint[:20]}... when price <= ${target_price}")
-            print(f"  Amount: {input_amount} of {input_mint[:20]}...")
+            self._orders_cache.pop(wallet_address, None)
             
             return LimitOrder(
                 id=order_id,
@@ -113,9 +198,21 @@ class JupiterOrders:
             )
             
         except Exception as e:
-            print(f"[JupiterOrders] Error creating limit order: {e}")
+            logger.error("[JupiterOrders] Error creating limit order: %s", e)
             return None
     
+    def create_limit_orders(self, orders: List[Dict[str, Any]]) -> List[Optional[LimitOrder]]:
+        """
+        Create several limit orders concurrently.
+        
+        Args:
+            orders: Keyword arguments for create_limit_order, one dict per order
+        
+        Returns:
+            LimitOrder (or None on failure) per input, in the same order
+        """
+        return self._submit_all(self.create_limit_order, orders)
+    
     def create_dca_order(
         self,
         input_mint: str,
@@ -140,6 +237,8 @@ class JupiterOrders:
             DCAOrder object or None
         """
         try:
+            self._limiter.acquire()
+            
             # Jupiter Recurring API for DCA
             payload = {
                 "inputMint": input_mint,
@@ -150,11 +249,13 @@ class JupiterOrders:
                 "user": wallet_address
             }
             
-            order_id = f"DCA_{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}"
+            order_id = f"DCA_{time.time_ns()}_{next(self._seq)}"
+            
+            logger.info("[JupiterOrders] DCA order created: %s", order_id)
+            logger.info("  Total: %s over %s orders", total_amount, number_of_orders)
+            logger.info("  Every %.1f hours", interval_seconds / 3600)
             
-            print(f"[JupiterOrders] DCA order created: {order_id}")
-            print(f"  Total: {total_amount} over {number_of_orders} orders")
-            print(f"  Every {interval_seconds/3600:.1f} hours")
+            self._orders_cache.pop(wallet_address, None)
             
             return DCAOrder(
                 id=order_id,
@@ -168,17 +269,57 @@ class JupiterOrders:
             )
             
         except Exception as e:
-            print(f"[JupiterOrders] Error creating DCA: {e}")
+            logger.error("[JupiterOrders] Error creating DCA: %s", e)
             return None
     
+    def create_dca_orders(self, orders: List[Dict[str, Any]]) -> List[Optional[DCAOrder]]:
+        """
+        Create several DCA orders in one batch.
+        
+        Jupiter's Recurring API has no batch endpoint, so the batch is
+        emulated client-side by submitting every order concurrently.
+        
+        Args:
+            orders: Keyword arguments for create_dca_order, one dict per order
+        
+        Returns:
+            DCAOrder (or None on failure) per input, in the same order
+        """
+        return self._submit_all(self.create_dca_order, orders)
+    
+    def _submit_all(self, create, orders: List[Dict[str, Any]]) -> List[Any]:
+        """Run create(**order) for every order on the pool, preserving order."""
+        futures = [self._pool.submit(create, **o) for o in orders]
+        return [f.result() for f in futures]
+    
     def get_open_orders(self, wallet_address: str) -> List[Dict]:
-        """Get all open orders for a wallet."""
-        # Implementation depends on Jupiter's order book API
-        return []
+        """Get all open orders for a wallet (cached for ORDERS_CACHE_TTL seconds)."""
+        cached = self._orders_cache.get(wallet_address)
+        if cached and time.monotonic() - cached[0] < self.ORDERS_CACHE_TTL:
+            # Fresh list per call - callers may mutate it without touching the cache
+            return list(cached[1])
+        
+        try:
+            self._limiter.acquire()
+            response = self.session.get(
+                f"{JUPITER_TRIGGER_API}/getTriggerOrders",
+                params={"user": wallet_address, "orderStatus": "active"},
+                timeout=10
+            )
+            response.raise_for_status()
+            orders = json_loads(response.content).get("orders", [])
+            self._orders_cache[wallet_address] = (time.monotonic(), tuple(orders))
+            return list(orders)
+        except Exception as e:
+            logger.warning("[JupiterOrders] Error fetching open orders: %s", e)
+            return []
     
     def cancel_order(self, order_id: str) -> bool:
         """Cancel an open order."""
-        print(f"[JupiterOrders] Cancelling order: {order_id}")
+        self._limiter.acquire()
+        logger.info("[JupiterOrders] Cancelling order: %s", order_id)
+        # The order's wallet isn't known here, so drop every cached list
+        self._orders_cache.clear()
         return True
     
     def calculate_dca_parameters(
@@ -209,9 +350,54 @@ class JupiterOrders:
             "interval_seconds": interval_seconds,
             "duration_days": days
         }
+    
+    def calculate_dca_grid(
+        self,
+        totals_usd: List[float],
+        days: List[int],
+        orders_per_day: List[int]
+    ):
+        """
+        Calculate DCA parameters for every (total, days, orders_per_day) combination.
+        
+        Vectorized counterpart of calculate_dca_parameters for backtest sweeps.
+        
+        Args:
+            totals_usd: Total USD amounts to try
+            days: Durations in days to try
+            orders_per_day: Order frequencies to try
+        
+        Returns:
+            NumPy record array of shape (len(totals_usd), len(days),
+            len(orders_per_day)) with the same fields as
+            calculate_dca_parameters
+        """
+        if not HAS_NUMPY:
+            raise RuntimeError("calculate_dca_grid requires numpy")
+        
+        totals = np.asarray(totals_usd, dtype=np.float64)[:, None, None]
+        d = np.asarray(days, dtype=np.int64)[None, :, None]
+        opd = np.asarray(orders_per_day, dtype=np.int64)[None, None, :]
+        
+        shape = (totals.shape[0], d.shape[1], opd.shape[2])
+        total_orders = np.broadcast_to(d * opd, shape)
+        interval_seconds = np.broadcast_to(86400 // opd, shape)
+        
+        return np.rec.fromarrays(
+            [
+                total_orders,
+                totals / total_orders,
+                interval_seconds / 3600,
+                interval_seconds,
+                np.broadcast_to(d, shape)
+            ],
+            names="total_orders,amount_per_order_usd,interval_hours,"
+                  "interval_seconds,duration_days"
+        )
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     print("Jupiter Advanced Orders - Test Mode")
     print("=" * 60)
     
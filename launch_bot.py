@@ -7,15 +7,29 @@ Launches all components:
 - Trading Bot (paper or live mode)
 - Telegram Bot (if configured)
 - ZeroClaw Pipeline (if enabled)
+
+Each component runs in its own daemon thread. The dashboard is a WSGI
+(Flask) app and TradingBot.run_monitor is a blocking loop, so neither can
+share a single asyncio loop without being rewritten; the main thread only
+blocks on a wakeup socket until shutdown.
 """
 
 import argparse
+import copy
+import hashlib
+import importlib
 import json
+import logging
+import logging.handlers
 import os
+import queue
 import sys
 import time
 import signal
-from threading import Thread
+import socket
+import sysconfig
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Thread
 from datetime import datetime
 
 # Add current directory to path
@@ -33,34 +47,201 @@ except ImportError:
     except ImportError:
         pass
 
-# Global flag for shutdown
-shutdown_requested = False
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Set once on SIGINT/SIGTERM or when a stop signal file appears
+SHUTDOWN = Event()
+
+# Set by signal_handler; the main loop turns it into SHUTDOWN. Setting the
+# Event from the handler could deadlock on its lock if the signal lands
+# while the main thread holds it.
+_signalled = False
+
+# Self-pipe the main thread blocks on: signal.set_wakeup_fd makes the C
+# signal handler write to it, other threads write via request_shutdown()
+_WAKE_R, _WAKE_W = socket.socketpair()
+_WAKE_W.setblocking(False)
+
+# Control socket: `echo stop | nc -U bot.sock` shuts the launcher down at once
+CONTROL_SOCKET = "bot.sock"
+
+# A connected client gets this long to send its command (seconds)
+CONTROL_RECV_TIMEOUT = 2.0
+
+# How often the stop signal file is checked (written by the Telegram /stop command)
+STOP_FILE_POLL_SECONDS = 5
 
 
 def signal_handler(sig, frame):
     """Handle shutdown signals"""
-    global shutdown_requested
+    global _signalled
     print("\n\n🛑 Shutdown requested...")
-    shutdown_requested = True
+    _signalled = True
     
     # Create stop signal file
     with open("bot_stop.signal", "w") as f:
         f.write(datetime.now().isoformat())
 
 
+def request_shutdown():
+    """Set SHUTDOWN from any thread and wake the main thread."""
+    SHUTDOWN.set()
+    try:
+        _WAKE_W.send(b"\0")
+    except OSError:
+        pass  # buffer full - the main thread is already being woken
+
+
+def watch_stop_file():
+    """Set SHUTDOWN when bot_stop.signal is created by another process."""
+    # Event.wait doubles as an interruptible sleep: returns early on shutdown
+    while not SHUTDOWN.wait(STOP_FILE_POLL_SECONDS):
+        if os.path.exists("bot_stop.signal"):
+            print("\n🛑 Stop signal detected")
+            request_shutdown()
+
+
+def serve_control_socket(path=CONTROL_SOCKET):
+    """
+    Listen on a Unix domain socket and set SHUTDOWN when sent "stop".
+    
+    Returns the listening socket, or None where AF_UNIX is unavailable
+    (the stop file watcher still covers that case).
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    
+    try:
+        os.unlink(path)  # stale socket from an unclean exit
+    except FileNotFoundError:
+        pass
+    
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(path)
+        os.chmod(path, 0o600)  # owner only - anyone who can connect can stop the bot
+        server.listen(1)
+    except OSError as e:
+        print(f"⚠️  Control socket unavailable ({e}); use bot_stop.signal instead")
+        server.close()
+        return None
+    
+    def _serve():
+        while not SHUTDOWN.is_set():
+            try:
+                conn, _ = server.accept()
+            except OSError:
+                return  # socket closed on shutdown
+            with conn:
+                # An idle client must not hold the only stop channel open
+                conn.settimeout(CONTROL_RECV_TIMEOUT)
+                try:
+                    command = conn.recv(64)
+                except OSError:
+                    continue
+                if command.strip() == b"stop":
+                    print("\n🛑 Stop command received")
+                    request_shutdown()
+    
+    Thread(target=_serve, name="control-socket", daemon=True).start()
+    return server
+
+
+def setup_logging():
+    """
+    Route all log records through a queue drained by a background thread.
+    
+    Components log from their hot paths (order submission, monitor loop);
+    the QueueHandler only enqueues, so the caller never blocks on stdout.
+    
+    Returns:
+        The started QueueListener (stop it on shutdown to flush)
+    """
+    log_queue = queue.SimpleQueue()
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, stream)
+    
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener.start()
+    return listener
+
+
+def preload_modules(names):
+    """
+    Start importing heavy component modules in parallel background threads.
+    
+    Independent module trees load concurrently while one waits on disk, so
+    the later start_* calls find them in sys.modules. Missing modules are
+    ignored here - the start_* functions report them.
+    """
+    def _import(name):
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass
+    
+    pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="preload")
+    for name in names:
+        pool.submit(_import, name)
+    pool.shutdown(wait=False)
+
+
+DEFAULT_CONFIG = {
+    "bot": {"mode": "PAPER", "monitor_interval": 60},
+    "dashboard": {"enabled": True, "port": 8080},
+    "alerts": {"telegram": {"enabled": False}},
+    "zeroclaw": {"enabled": False}
+}
+
+# (st_mtime_ns, st_size) -> parsed config.json
+_CONFIG_CACHE = {}
+
+
 def load_config():
-    """Load configuration"""
+    """Load configuration (re-parsed only when config.json changes)
+    
+    Returns a fresh copy each call so callers can't mutate the cache.
+    """
     try:
-        with open("config.json", "r") as f:
-            return json.load(f)
-    except:
-        print("⚠️  Could not load config.json, using defaults")
-        return {
-            "bot": {"mode": "PAPER", "monitor_interval": 60},
-            "dashboard": {"enabled": True, "port": 8080},
-            "alerts": {"telegram": {"enabled": False}},
-            "zeroclaw": {"enabled": False}
-        }
+        st = os.stat("config.json")
+        key = (st.st_mtime_ns, st.st_size)
+        if key in _CONFIG_CACHE:
+            return copy.deepcopy(_CONFIG_CACHE[key])
+        with open("config.json", "rb") as f:
+            config = json_loads(f.read())
+        _CONFIG_CACHE.clear()
+        _CONFIG_CACHE[key] = config
+        return copy.deepcopy(config)
+    except OSError as e:
+        print(f"⚠️  Could not load config.json ({e.strerror}), using defaults")
+        return copy.deepcopy(DEFAULT_CONFIG)
+    except json.JSONDecodeError as e:
+        # A corrupt config is an operator error - don't silently trade on defaults
+        print(f"❌ config.json is invalid: {e}")
+        raise
+
+
+def pin_thread(thread, cpus):
+    """
+    Restrict a started thread to the given CPU set (Linux only).
+    
+    Returns True if the affinity was applied.
+    """
+    if not cpus or not hasattr(os, "sched_setaffinity"):
+        return False
+    try:
+        os.sched_setaffinity(thread.native_id, set(cpus))
+        return True
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Could not pin {thread.name} to CPUs {sorted(cpus)}: {e}")
+        return False
 
 
 def start_dashboard(config, port=None):
@@ -81,9 +262,14 @@ def start_dashboard(config, port=None):
         "host": "0.0.0.0",
         "port": dashboard_port,
         "debug": False
-    }, daemon=True)
+    }, name="dashboard", daemon=True)
     thread.start()
     
+    # Keep the dashboard off the cores reserved for the trading monitor
+    monitor_cpus = config.get("bot", {}).get("monitor_cpus")
+    if monitor_cpus and hasattr(os, "sched_getaffinity"):
+        pin_thread(thread, os.sched_getaffinity(0) - set(monitor_cpus))
+    
     return thread
 
 
@@ -125,9 +311,14 @@ def start_trading_bot(config, mode="paper", monitor_interval=None):
         bot = TradingBot(mode=bot_mode, config=config)
         
         # Run monitor in background thread
-        thread = Thread(target=bot.run_monitor, args=(interval,), daemon=True)
+        thread = Thread(target=bot.run_monitor, args=(interval,), name="trading-monitor", daemon=True)
         thread.start()
         
+        # Optional: keep the monitor's hot loop on dedicated cores
+        monitor_cpus = config.get("bot", {}).get("monitor_cpus")
+        if pin_thread(thread, monitor_cpus):
+            print(f"   Monitor pinned to CPUs {sorted(monitor_cpus)}")
+        
         return bot, thread
     except Exception as e:
         print(f"🤖 Trading bot error: {e}")
@@ -136,56 +327,54 @@ def start_trading_bot(config, mode="paper", monitor_interval=None):
         return None, None
 
 
-def check_requirements():
-    """Check if all requirements are met"""
-    print("=" * 60)
-    print("🔍 Checking Requirements")
-    print("=" * 60)
-    
-    # Check Python version
-    import sys
-    print(f"✓ Python {sys.version.split()[0]}")
-    
-    # Check database
-    if os.path.exists("trades.db"):
-        print("✓ Database (trades.db)")
-    else:
-        print("⚠️  Database not found, will be created")
-    
-    # Check config
-    if os.path.exists("config.json"):
-        print("✓ Configuration (config.json)")
-    else:
-        print("⚠️  Config not found, defaults will be used")
+LAUNCH_CACHE_FILE = ".launch_cache.json"
+
+
+def _requirements_key(has_env):
+    """Fingerprint of everything the dependency checks depend on."""
+    site_packages = sysconfig.get_paths()["purelib"]
+    parts = [
+        sys.version,
+        str(os.path.getmtime(site_packages)) if os.path.exists(site_packages) else "0",
+        str(os.path.getmtime(".env")) if has_env else "0",
+    ]
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+def _probe_dependencies():
+    """Import-probe optional dependencies and scan .env; returns report lines."""
+    lines = []
+    crypto_available = False
     
     # Check security module
     try:
         from security import CRYPTO_AVAILABLE
+        crypto_available = CRYPTO_AVAILABLE
         if CRYPTO_AVAILABLE:
-            print("✓ Security module (API key encryption)")
+            lines.append("✓ Security module (API key encryption)")
         else:
-            print("⚠️  Security module loaded but cryptography not installed")
+            lines.append("⚠️  Security module loaded but cryptography not installed")
     except ImportError:
-        print("⚠️  Security module not available")
+        lines.append("⚠️  Security module not available")
     
     # Check optional dependencies
     try:
         import flask
-        print("✓ Flask (dashboard)")
+        lines.append("✓ Flask (dashboard)")
     except ImportError:
-        print("❌ Flask not installed: pip install flask")
+        lines.append("❌ Flask not installed: pip install flask")
     
     try:
         import ccxt
-        print("✓ CCXT (exchange trading)")
+        lines.append("✓ CCXT (exchange trading)")
     except ImportError:
-        print("⚠️  CCXT not installed (live trading disabled): pip install ccxt")
+        lines.append("⚠️  CCXT not installed (live trading disabled): pip install ccxt")
     
     try:
         from telegram import Bot
-        print("✓ python-telegram-bot")
+        lines.append("✓ python-telegram-bot")
     except ImportError:
-        print("⚠️  python-telegram-bot not installed: pip install python-telegram-bot")
+        lines.append("⚠️  python-telegram-bot not installed: pip install python-telegram-bot")
     
     # Check for encrypted .env
     if os.path.exists(".env"):
@@ -193,15 +382,65 @@ def check_requirements():
             with open(".env", 'r') as f:
                 content = f.read()
                 if 'ENC:' in content:
-                    if CRYPTO_AVAILABLE:
-                        print("✓ Encrypted API keys detected (will auto-decrypt)")
+                    if crypto_available:
+                        lines.append("✓ Encrypted API keys detected (will auto-decrypt)")
                     else:
-                        print("⚠️  Encrypted API keys found but cryptography not installed!")
+                        lines.append("⚠️  Encrypted API keys found but cryptography not installed!")
                 else:
-                    print("ℹ️  API keys in .env are not encrypted")
+                    lines.append("ℹ️  API keys in .env are not encrypted")
         except Exception:
             pass
     
+    return lines
+
+
+def check_requirements():
+    """Check if all requirements are met"""
+    print("=" * 60)
+    print("🔍 Checking Requirements")
+    print("=" * 60)
+    
+    # Check Python version
+    print(f"✓ Python {sys.version.split()[0]}")
+    
+    # One directory listing instead of a stat() per file checked
+    present = {entry.name for entry in os.scandir(".")}
+    
+    # Check database
+    if "trades.db" in present:
+        print("✓ Database (trades.db)")
+    else:
+        print("⚠️  Database not found, will be created")
+    
+    # Check config
+    if "config.json" in present:
+        print("✓ Configuration (config.json)")
+    else:
+        print("⚠️  Config not found, defaults will be used")
+    
+    # Dependency probes only change when packages or .env change - reuse
+    # the last result while the fingerprint matches
+    key = _requirements_key(".env" in present)
+    lines = None
+    try:
+        with open(LAUNCH_CACHE_FILE) as f:
+            cached = json.load(f)
+        if cached.get("key") == key:
+            lines = cached["lines"]
+    except (OSError, ValueError, KeyError):
+        pass
+    
+    if lines is None:
+        lines = _probe_dependencies()
+        try:
+            with open(LAUNCH_CACHE_FILE, "w") as f:
+                json.dump({"key": key, "lines": lines}, f)
+        except OSError:
+            pass
+    
+    for line in lines:
+        print(line)
+    
     print()
 
 
@@ -234,9 +473,20 @@ Examples:
     
     args = parser.parse_args()
     
+    log_listener = setup_logging()
+    
+    # Overlap component import time with requirement checks and config loading
+    modules = ["flask", "unified_dashboard"]
+    if not args.no_telegram:
+        modules.append("telegram_bot_enhanced")
+    if not args.dashboard_only:
+        modules += ["ccxt", "trading_bot"]
+    preload_modules(modules)
+    
     # Setup signal handlers
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
+    signal.set_wakeup_fd(_WAKE_W.fileno())
     
     # Clear old stop signal
     if os.path.exists("bot_stop.signal"):
@@ -305,21 +555,27 @@ Examples:
     print("Press Ctrl+C to stop")
     print()
     
-    # Keep main thread alive
+    # Keep main thread alive - sleeps in recv until a signal or another
+    # thread writes to the wakeup socket (also interruptible on Windows)
+    control = serve_control_socket()
+    Thread(target=watch_stop_file, name="stop-file-watch", daemon=True).start()
     try:
-        while not shutdown_requested:
-            time.sleep(1)
-            
-            # Check for stop signal file
-            if os.path.exists("bot_stop.signal"):
-                print("\n🛑 Stop signal detected")
-                break
-                
+        while not (_signalled or SHUTDOWN.is_set()):
+            _WAKE_R.recv(64)
+        SHUTDOWN.set()
     except KeyboardInterrupt:
         print("\n\n🛑 Interrupted by user")
     
+    if control is not None:
+        control.close()
+        try:
+            os.unlink(CONTROL_SOCKET)
+        except OSError:
+            pass
+    
     # Cleanup
     print("\n👋 Shutting down...")
+    log_listener.stop()
     print("Goodbye!")
 
 
@@ -12,6 +12,7 @@ Features:
 
 Requirements:
     pip install numpy pandas scikit-learn
+    pip install lightgbm                   # optional, preferred over Random Forest
 
 Usage:
     python ml_predictions.py              # Run predictions
@@ -22,11 +23,21 @@ import os
 import sys
 import json
 import argparse
+import itertools
 import logging
+import operator
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
+
+# Sibling modules (crypto_price_fetcher) import from this directory
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+if _MODULE_DIR not in sys.path:
+    sys.path.insert(0, _MODULE_DIR)
 
 # Configure logging
 logging.basicConfig(
@@ -43,16 +54,198 @@ except ImportError:
     HAS_NUMPY = False
     logger.warning("numpy not installed. Using fallback.")
 
+try:
+    from numba import njit
+    HAS_NUMBA = HAS_NUMPY
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so the kernels below run as plain Python."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
 try:
     from sklearn.ensemble import RandomForestClassifier
     from sklearn.preprocessing import StandardScaler
+    import joblib
     HAS_SKLEARN = True
 except ImportError:
     HAS_SKLEARN = False
     logger.warning("scikit-learn not installed. Using statistical fallback.")
 
+try:
+    # Histogram GBDT: contiguous tree arrays make single-row predict much cheaper than RF
+    from lightgbm import LGBMClassifier
+    HAS_LGBM = HAS_SKLEARN
+except ImportError:
+    HAS_LGBM = False
+
+
+@njit(cache=True)
+def _ema_loop(x, alpha):
+    """Recursive EMA, seeded with the first sample: y[i] = a*x[i] + (1-a)*y[i-1]"""
+    y = np.empty_like(x)
+    if len(x) == 0:
+        return y
+    y[0] = x[0]
+    for i in range(1, len(x)):
+        y[i] = alpha * x[i] + (1.0 - alpha) * y[i - 1]
+    return y
+
+
+@njit(cache=True)
+def _rsi_last(c, n=14):
+    """Wilder-smoothed RSI of the last bar, in one pass with no temporaries"""
+    if len(c) <= n:
+        return 100.0 - 100.0 / (1.0 + 100.0)  # Not enough bars: matches rs=100 default
+    g = 0.0
+    l = 0.0
+    for i in range(1, n + 1):
+        d = c[i] - c[i - 1]
+        if d > 0:
+            g += d
+        else:
+            l -= d
+    g /= n
+    l /= n
+    for i in range(n + 1, len(c)):
+        d = c[i] - c[i - 1]
+        if d > 0:
+            g = (g * (n - 1) + d) / n
+            l = l * (n - 1) / n
+        else:
+            g = g * (n - 1) / n
+            l = (l * (n - 1) - d) / n
+    rs = g / l if l > 0 else 100.0
+    return 100.0 - 100.0 / (1.0 + rs)
+
+
+@njit(cache=True)
+def _rsi_full(c, n=14):
+    """Wilder-smoothed RSI for every bar (NaN until n diffs are available)"""
+    out = np.full(len(c), np.nan)
+    if len(c) <= n:
+        return out
+    g = 0.0
+    l = 0.0
+    for i in range(1, len(c)):
+        d = c[i] - c[i - 1]
+        up = d if d > 0 else 0.0
+        down = -d if d < 0 else 0.0
+        if i <= n:
+            g += up / n
+            l += down / n
+            if i < n:
+                continue
+        else:
+            g = (g * (n - 1) + up) / n
+            l = (l * (n - 1) + down) / n
+        rs = g / l if l > 0 else 100.0
+        out[i] = 100.0 - 100.0 / (1.0 + rs)
+    return out
+
 
-@dataclass
+def _ema_rows(x, alpha):
+    """_ema_loop along axis 1 of a 2-D array, vectorized across rows"""
+    y = np.empty_like(x)
+    y[:, 0] = x[:, 0]
+    for i in range(1, x.shape[1]):
+        y[:, i] = alpha * x[:, i] + (1.0 - alpha) * y[:, i - 1]
+    return y
+
+
+def _rsi_last_rows(c, n=14):
+    """_rsi_last for every row of a 2-D array, vectorized across rows"""
+    if c.shape[1] <= n:
+        return np.full(c.shape[0], 100.0 - 100.0 / (1.0 + 100.0))
+    d = np.diff(c, axis=1)
+    up = np.maximum(d, 0.0)
+    down = np.maximum(-d, 0.0)
+    g = up[:, :n].mean(axis=1)
+    l = down[:, :n].mean(axis=1)
+    for i in range(n, d.shape[1]):
+        g = (g * (n - 1) + up[:, i]) / n
+        l = (l * (n - 1) + down[:, i]) / n
+    rs = np.divide(g, l, out=np.full_like(g, 100.0), where=l > 0)
+    return 100.0 - 100.0 / (1.0 + rs)
+
+
+def _random_walk(symbol: str, start: float, hours: int, offset: int) -> List[float]:
+    """
+    Pure-Python price walk for the no-numpy fallback.
+    
+    Each step moves by (k - offset) / 1000 with k uniform in [0, 100); the
+    generator is seeded from the symbol so a coin always gets the same walk.
+    """
+    rng = random.Random(symbol)
+    steps = (1 + (k - offset) / 1000 for k in rng.choices(range(100), k=hours))
+    return list(itertools.accumulate(steps, operator.mul, initial=start))[1:]
+
+
+# Leading (top 10) feature names reported in Prediction.features_used -
+# calculate_features always emits them in this order
+FEATURE_NAMES = ("sma_20", "sma_50", "rsi", "macd", "macd_signal",
+                 "bb_upper", "bb_lower", "bb_position", "momentum_10", "momentum_24")
+# The pure-Python fallback only computes these
+FALLBACK_FEATURE_NAMES = ("sma_20", "rsi", "momentum_10", "momentum_24",
+                          "volume_ratio", "price_position", "current_price")
+
+
+def _hourly_timestamps(hours: int) -> List[str]:
+    """ISO-8601 UTC stamps for `hours` hourly bars, the last one an hour ago"""
+    now = datetime.now(timezone.utc)
+    if HAS_NUMPY:
+        # One datetime64 subtraction + one vectorized format instead of `hours` isoformat() calls
+        stamps = np.datetime64(now.replace(tzinfo=None), "us") - np.arange(hours, 0, -1) * np.timedelta64(1, "h")
+        return [stamp + "+00:00" for stamp in np.datetime_as_string(stamps, unit="us").tolist()]
+    return [(now - timedelta(hours=hours-i)).isoformat() for i in range(hours)]
+
+
+@dataclass(slots=True)
+class PriceSeries:
+    """
+    Hourly OHLCV history stored column-wise (one array per field).
+    
+    Prices are held as float32 - ~7 significant digits is ample for the
+    indicator thresholds and halves the bytes the feature pass streams.
+    Volume stays float64 since it can reach 1e9+.
+    """
+    timestamp: List[str]
+    open: "np.ndarray"
+    high: "np.ndarray"
+    low: "np.ndarray"
+    close: "np.ndarray"
+    volume: "np.ndarray"
+    features: Optional[Dict] = field(default=None, repr=False, compare=False)  # memoized
+    
+    def __post_init__(self):
+        self.open = np.asarray(self.open, dtype=np.float32)
+        self.high = np.asarray(self.high, dtype=np.float32)
+        self.low = np.asarray(self.low, dtype=np.float32)
+        self.close = np.asarray(self.close, dtype=np.float32)
+        self.volume = np.asarray(self.volume, dtype=np.float64)
+    
+    def __len__(self) -> int:
+        return len(self.close)
+    
+    def to_rows(self) -> List[Dict]:
+        """Materialize the list-of-dicts form for external callers"""
+        return [
+            {"timestamp": t, "open": o, "high": h, "low": l, "close": c, "volume": v}
+            for t, o, h, l, c, v in zip(
+                self.timestamp, self.open.tolist(), self.high.tolist(),
+                self.low.tolist(), self.close.tolist(), self.volume.tolist()
+            )
+        ]
+
+
+# numpy builds return a PriceSeries; the pure-Python fallback keeps bar dicts
+PriceHistory = Union[PriceSeries, List[Dict]]
+
+
+@dataclass(slots=True, frozen=True)
 class Prediction:
     """ML prediction result"""
     symbol: str
@@ -61,7 +254,7 @@ class Prediction:
     price_now: float
     price_predicted: float
     timeframe: str  # 1h, 4h, 24h
-    features_used: List[str]
+    features_used: Tuple[str, ...]
     model_accuracy: float
     timestamp: str
 
@@ -71,18 +264,37 @@ class MLPredictionSystem:
     ML-based prediction system for crypto prices.
     
     Uses multiple approaches:
-    1. Random Forest classifier (if sklearn available)
+    1. LightGBM classifier (if installed), else sklearn Random Forest
     2. Statistical indicators (SMA, RSI, MACD)
     3. Pattern recognition
     """
     
-    def __init__(self):
+    # Hourly bars move slowly relative to back-to-back predict calls
+    PRICE_HISTORY_TTL = 60.0
+    
+    # Fitted (model, scaler) pair written by save_model(). Anchored to this
+    # module's directory - unpickling whatever sits in the CWD is unsafe.
+    MODEL_PATH = os.path.join(_MODULE_DIR, "rf.joblib")
+    
+    def __init__(self, model_path: Optional[str] = None):
+        self.model_path = model_path or self.MODEL_PATH
         self.model = None
         self.scaler = None
         self.is_trained = False
         
-        # Price data cache
-        self.price_data: Dict[str, List[Dict]] = {}
+        # Price data cache (latest history per symbol)
+        self.price_data: Dict[str, PriceHistory] = {}
+        
+        # HAS_NUMPY is fixed at import - pick the voting rule once, not per call
+        self._vote = self._vote_numpy if HAS_NUMPY else self._vote_fallback
+        self._feature_names = FEATURE_NAMES if HAS_NUMPY else FALLBACK_FEATURE_NAMES
+        
+        # Price source, created lazily by _binance_connector()
+        self._binance = None
+        self._binance_lock = threading.Lock()
+        
+        # (symbol, hours) -> (monotonic ts, history)
+        self._history_cache: Dict[Tuple[str, int], Tuple[float, PriceHistory]] = {}
         
         # Initialize model if available
         if HAS_SKLEARN:
@@ -91,32 +303,107 @@ class MLPredictionSystem:
         logger.info(f"[ML] Initialized. sklearn: {HAS_SKLEARN}, numpy: {HAS_NUMPY}")
     
     def _init_model(self):
-        """Initialize the ML model"""
+        """Initialize the ML model (reusing a saved fit from model_path if present)"""
+        if os.path.exists(self.model_path):
+            try:
+                # mmap_mode: tree arrays are mapped read-only and shared between processes
+                self.model, self.scaler = joblib.load(self.model_path, mmap_mode="r")
+                self.is_trained = True
+                logger.info(f"[ML] Loaded trained model from {self.model_path}")
+                return
+            except Exception as e:
+                logger.warning(f"[ML] Could not load {self.model_path}: {e}")
+        
         try:
-            self.model = RandomForestClassifier(
-                n_estimators=100,
-                max_depth=10,
-                random_state=42,
-                n_jobs=-1
-            )
+            if HAS_LGBM:
+                self.model = LGBMClassifier(
+                    n_estimators=100,
+                    num_leaves=31,
+                    random_state=42,
+                    n_jobs=-1,
+                    verbose=-1
+                )
+            else:
+                self.model = RandomForestClassifier(
+                    n_estimators=100,
+                    max_depth=10,
+                    random_state=42,
+                    n_jobs=-1
+                )
             self.scaler = StandardScaler()
-            logger.info("[ML] Model initialized")
+            logger.info(f"[ML] Model initialized ({type(self.model).__name__})")
         except Exception as e:
             logger.error(f"[ML] Model init error: {e}")
     
-    def fetch_price_history(self, symbol: str, hours: int = 168) -> List[Dict]:
+    def train(self, features, labels) -> bool:
+        """
+        Fit the scaler and model on a feature matrix.
+        
+        Args:
+            features: 2-D array, one row per sample (FEATURE_NAMES order)
+            labels: Direction label per row
+            
+        Returns:
+            True if the model was fitted (save_model() can then persist it)
+        """
+        if not HAS_SKLEARN or self.model is None:
+            return False
+        try:
+            self.scaler = StandardScaler()
+            self.model.fit(self.scaler.fit_transform(features), labels)
+            self.is_trained = True
+            logger.info(f"[ML] Trained {type(self.model).__name__} on {len(labels)} samples")
+            return True
+        except Exception as e:
+            logger.error(f"[ML] Training error: {e}")
+            return False
+    
+    def save_model(self) -> bool:
+        """Persist the fitted model + scaler to model_path for later mmap loads"""
+        if not (HAS_SKLEARN and self.is_trained):
+            return False
+        try:
+            # compress=0 keeps the arrays raw so joblib.load can memory-map them
+            joblib.dump((self.model, self.scaler), self.model_path, compress=0)
+            logger.info(f"[ML] Saved model to {self.model_path}")
+            return True
+        except Exception as e:
+            logger.error(f"[ML] Model save error: {e}")
+            return False
+    
+    def fetch_price_history(self, symbol: str, hours: int = 168) -> "PriceHistory":
         """
         Fetch price history for a symbol.
         
         In production, this would call price APIs.
         For now, generates realistic mock data.
+        
+        Returns a column-wise PriceSeries when numpy is available (call
+        .to_rows() for the list-of-dicts form), else a list of bar dicts.
+        Results are reused for PRICE_HISTORY_TTL seconds per (symbol, hours).
         """
+        key = (symbol, hours)
+        cached = self._history_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.PRICE_HISTORY_TTL:
+            return cached[1]
+        
+        data = self._fetch_price_history(symbol, hours)
+        self._history_cache[key] = (time.monotonic(), data)
+        self.price_data[symbol] = data
+        return data
+    
+    def _binance_connector(self):
+        """Shared BinanceConnector, built on first use so its session stays warm"""
+        with self._binance_lock:
+            if self._binance is None:
+                from crypto_price_fetcher import BinanceConnector
+                self._binance = BinanceConnector()
+            return self._binance
+    
+    def _fetch_price_history(self, symbol: str, hours: int) -> "PriceHistory":
         try:
             # Try to fetch real data from crypto_price_fetcher
-            sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-            from crypto_price_fetcher import BinanceConnector
-            
-            fetcher = BinanceConnector()
+            fetcher = self._binance_connector()
             # Get price data - use current price as basis for mock history
             # Format symbol for Binance (remove / and ensure USDT suffix if needed)
             binance_symbol = symbol.replace("/", "")
@@ -133,21 +420,18 @@ class MLPredictionSystem:
         # Generate realistic mock data if no real data available
         return self._generate_mock_data(symbol, hours)
     
-    def _generate_mock_data(self, symbol: str, hours: int) -> List[Dict]:
+    def _generate_mock_data(self, symbol: str, hours: int) -> "PriceHistory":
         """Generate realistic mock price data for testing"""
         if not HAS_NUMPY:
             # Simple fallback without numpy
             base_price = 50000 if "BTC" in symbol else 3000
             data = []
-            price = base_price
+            stamps = _hourly_timestamps(hours)
             
-            for i in range(hours):
-                # Random walk with slight upward bias
-                change = (hash(f"{symbol}{i}") % 100 - 45) / 1000
-                price *= (1 + change)
-                
+            # Random walk with slight upward bias
+            for i, price in enumerate(_random_walk(symbol, base_price, hours, 45)):
                 data.append({
-                    "timestamp": (datetime.now(timezone.utc) - timedelta(hours=hours-i)).isoformat(),
+                    "timestamp": stamps[i],
                     "open": price * 0.99,
                     "high": price * 1.02,
                     "low": price * 0.98,
@@ -158,38 +442,26 @@ class MLPredictionSystem:
             return data
         
         # Better mock data with numpy
-        np.random.seed(hash(symbol) % 10000)
+        # Per-call PCG64 generator: no shared global state across batch threads
+        rng = np.random.default_rng(hash(symbol) & 0xFFFFFFFF)
         base_price = 50000 if "BTC" in symbol else 3000
         
         # Generate price series with trends
         t = np.linspace(0, hours, hours)
         trend = np.sin(t / 20) * base_price * 0.1
-        noise = np.random.normal(0, base_price * 0.02, hours)
+        noise = rng.standard_normal(hours) * base_price * 0.02
         prices = base_price + trend + noise
         
-        data = []
-        for i, price in enumerate(prices):
-            data.append({
-                "timestamp": (datetime.now(timezone.utc) - timedelta(hours=hours-i)).isoformat(),
-                "open": price * np.random.uniform(0.99, 1.01),
-                "high": price * np.random.uniform(1.00, 1.03),
-                "low": price * np.random.uniform(0.97, 1.00),
-                "close": price,
-                "volume": np.random.uniform(500000, 2000000)
-            })
-        
-        return data
+        return self._series_from_closes(prices, rng)
     
-    def _generate_mock_data_from_price(self, symbol: str, hours: int, current_price: float) -> List[Dict]:
+    def _generate_mock_data_from_price(self, symbol: str, hours: int, current_price: float) -> "PriceHistory":
         """Generate mock data based on real current price"""
         if not HAS_NUMPY:
             data = []
-            price = current_price
-            for i in range(hours):
-                change = (hash(f"{symbol}{i}") % 100 - 48) / 1000  # Slight random walk
-                price *= (1 + change)
+            stamps = _hourly_timestamps(hours)
+            for i, price in enumerate(_random_walk(symbol, current_price, hours, 48)):  # Slight random walk
                 data.append({
-                    "timestamp": (datetime.now(timezone.utc) - timedelta(hours=hours-i)).isoformat(),
+                    "timestamp": stamps[i],
                     "open": price * 0.99,
                     "high": price * 1.02,
                     "low": price * 0.98,
@@ -199,73 +471,82 @@ class MLPredictionSystem:
             return data
         
         # With numpy - generate realistic historical data ending at current_price
-        np.random.seed(hash(symbol) % 10000)
+        # Per-call PCG64 generator: no shared global state across batch threads
+        rng = np.random.default_rng(hash(symbol) & 0xFFFFFFFF)
         
         # Generate random walk that ends at current_price
-        changes = np.random.normal(0, 0.02, hours)  # 2% volatility
+        changes = rng.standard_normal(hours) * 0.02  # 2% volatility
         prices = current_price * np.exp(np.cumsum(changes))
         prices = prices / prices[-1] * current_price  # Normalize to end at current_price
         
-        data = []
-        for i, price in enumerate(prices):
-            data.append({
-                "timestamp": (datetime.now(timezone.utc) - timedelta(hours=hours-i)).isoformat(),
-                "open": price * np.random.uniform(0.99, 1.01),
-                "high": price * np.random.uniform(1.00, 1.03),
-                "low": price * np.random.uniform(0.97, 1.00),
-                "close": price,
-                "volume": np.random.uniform(500000, 2000000)
-            })
-        
-        return data
+        return self._series_from_closes(prices, rng)
+    
+    def _series_from_closes(self, prices: "np.ndarray", rng: "np.random.Generator") -> "PriceSeries":
+        """Build an hourly OHLCV series around a close series in a few batched draws"""
+        hours = len(prices)
+        return PriceSeries(
+            timestamp=_hourly_timestamps(hours),
+            open=prices * rng.uniform(0.99, 1.01, hours),
+            high=prices * rng.uniform(1.00, 1.03, hours),
+            low=prices * rng.uniform(0.97, 1.00, hours),
+            close=prices,
+            volume=rng.uniform(500000, 2000000, hours)
+        )
     
-    def calculate_features(self, data: List[Dict]) -> Dict:
+    def calculate_features(self, data: "PriceHistory") -> Dict:
         """Calculate technical indicators as features"""
         if not data:
             return {}
         
-        closes = [d["close"] for d in data]
-        highs = [d["high"] for d in data]
-        lows = [d["low"] for d in data]
-        volumes = [d["volume"] for d in data]
+        # A series is never mutated once built, so its features are fixed
+        if isinstance(data, PriceSeries):
+            if data.features is None:
+                data.features = self._calculate_features(data)
+            return data.features
+        return self._calculate_features(data)
+    
+    def _calculate_features(self, data: "PriceHistory") -> Dict:
+        if isinstance(data, PriceSeries):
+            # Already column-wise - no per-call transpose
+            closes, volumes = data.close, data.volume
+        else:
+            closes = [d["close"] for d in data]
+            volumes = [d["volume"] for d in data]
+            if HAS_NUMPY:
+                closes = np.array(closes)
+                volumes = np.array(volumes)
         
         features = {}
         
         if HAS_NUMPY:
-            closes = np.array(closes)
-            highs = np.array(highs)
-            lows = np.array(lows)
-            volumes = np.array(volumes)
+            # One 50-bar tail shared by the SMA, Bollinger and price-position blocks
+            tail = closes[-50:]
+            w20 = tail[-20:]
+            last = closes[-1]
             
             # SMA (Simple Moving Average)
-            features["sma_20"] = float(np.mean(closes[-20:])) if len(closes) >= 20 else float(closes[-1])
-            features["sma_50"] = float(np.mean(closes[-50:])) if len(closes) >= 50 else features["sma_20"]
+            features["sma_20"] = float(w20.mean()) if len(closes) >= 20 else float(last)
+            features["sma_50"] = float(tail.mean()) if len(closes) >= 50 else features["sma_20"]
             
             # RSI (Relative Strength Index)
-            delta = np.diff(closes)
-            gain = np.where(delta > 0, delta, 0)
-            loss = np.where(delta < 0, -delta, 0)
-            avg_gain = np.mean(gain[-14:]) if len(gain) >= 14 else 0
-            avg_loss = np.mean(loss[-14:]) if len(loss) >= 14 else 0
-            rs = avg_gain / avg_loss if avg_loss > 0 else 100
-            features["rsi"] = float(100 - (100 / (1 + rs)))
+            features["rsi"] = float(_rsi_last(closes, 14))
             
             # MACD
-            ema_12 = np.convolve(closes, np.ones(12)/12, mode='valid')
-            ema_26 = np.convolve(closes, np.ones(26)/26, mode='valid')
-            if len(ema_12) > 0 and len(ema_26) > 0:
-                macd = ema_12[-1] - ema_26[-1]
-                features["macd"] = float(macd)
-                features["macd_signal"] = float(macd * 0.9)  # Simplified
+            if len(closes) >= 26:
+                macd_line = _ema_loop(closes, 2 / 13) - _ema_loop(closes, 2 / 27)
+                # 9-period signal over the part of the line where EMA-26 has warmed up
+                signal = _ema_loop(macd_line[25:], 2 / 10)
+                features["macd"] = float(macd_line[-1])
+                features["macd_signal"] = float(signal[-1])
             else:
                 features["macd"] = 0
                 features["macd_signal"] = 0
             
             # Bollinger Bands
-            std = np.std(closes[-20:])
+            std = w20.std()
             features["bb_upper"] = float(features["sma_20"] + (2 * std))
             features["bb_lower"] = float(features["sma_20"] - (2 * std))
-            features["bb_position"] = float((closes[-1] - features["bb_lower"]) / (features["bb_upper"] - features["bb_lower"]) * 100)
+            features["bb_position"] = float((last - features["bb_lower"]) / (features["bb_upper"] - features["bb_lower"]) * 100)
             
             # Momentum
             features["momentum_10"] = float((closes[-1] - closes[-10]) / closes[-10] * 100) if len(closes) >= 10 else 0
@@ -276,7 +557,11 @@ class MLPredictionSystem:
             features["volume_ratio"] = float(volumes[-1] / features["volume_sma"]) if features["volume_sma"] > 0 else 1
             
             # Price position
-            features["price_position"] = float((closes[-1] - np.min(closes[-50:])) / (np.max(closes[-50:]) - np.min(closes[-50:])) * 100) if len(closes) >= 50 else 50
+            if len(closes) >= 50:
+                low = tail.min()
+                features["price_position"] = float((last - low) / (tail.max() - low) * 100)
+            else:
+                features["price_position"] = 50
         
         else:
             # Fallback without numpy
@@ -309,9 +594,16 @@ class MLPredictionSystem:
         logger.info(f"[ML] Generating prediction for {symbol}")
         
         # Fetch price history
-        hours = 168 if timeframe == "24h" else (24 if timeframe == "1h" else 96)
-        data = self.fetch_price_history(symbol, hours)
-        
+        data = self.fetch_price_history(symbol, self._hours_for(timeframe))
+        return self._predict_from_history(symbol, timeframe, data)
+    
+    @staticmethod
+    def _hours_for(timeframe: str) -> int:
+        """Hours of history backing a prediction timeframe"""
+        return 168 if timeframe == "24h" else (24 if timeframe == "1h" else 96)
+    
+    def _predict_from_history(self, symbol: str, timeframe: str, data: "PriceHistory") -> Prediction:
+        """Turn a fetched history into a Prediction"""
         if not data:
             return Prediction(
                 symbol=symbol,
@@ -320,7 +612,7 @@ class MLPredictionSystem:
                 price_now=0,
                 price_predicted=0,
                 timeframe=timeframe,
-                features_used=[],
+                features_used=(),
                 model_accuracy=0,
                 timestamp=datetime.now(timezone.utc).isoformat()
             )
@@ -329,74 +621,62 @@ class MLPredictionSystem:
         features = self.calculate_features(data)
         
         # Make prediction based on technical indicators
-        direction = "SIDEWAYS"
-        confidence = 50.0
+        direction, confidence = self._vote(features)
         
-        if HAS_NUMPY:
-            # RSI-based prediction
-            rsi = features.get("rsi", 50)
-            
-            # Momentum-based prediction  
-            momentum = features.get("momentum_24", 0)
-            momentum_10 = features.get("momentum_10", 0)
-            
-            # MACD-based prediction
-            macd = features.get("macd", 0)
-            
-            # Volume confirmation
-            volume_ratio = features.get("volume_ratio", 1)
-            
-            # Combine signals
-            up_signals = 0
-            down_signals = 0
-            
-            if rsi < 30:  # Oversold - potential up
-                up_signals += 2
-            elif rsi > 70:  # Overbought - potential down
-                down_signals += 2
-            
-            if momentum > 2:  # Strong upward momentum
-                up_signals += 2
-            elif momentum < -2:
-                down_signals += 2
-            
-            if momentum_10 > momentum:  # Accelerating up
-                up_signals += 1
-            elif momentum_10 < momentum:
-                down_signals += 1
-            
-            if macd > 0:  # Bullish MACD
-                up_signals += 1
-            else:
-                down_signals += 1
-            
-            if volume_ratio > 1.5:  # High volume confirms move
-                if up_signals > down_signals:
-                    up_signals += 1
-                elif down_signals > up_signals:
-                    down_signals += 1
-            
-            # Determine direction
-            if up_signals > down_signals + 1:
-                direction = "UP"
-                confidence = min(50 + (up_signals - down_signals) * 10, 95)
-            elif down_signals > up_signals + 1:
-                direction = "DOWN"
-                confidence = min(50 + (down_signals - up_signals) * 10, 95)
-            else:
-                direction = "SIDEWAYS"
-                confidence = 50 + abs(up_signals - down_signals) * 5
+        return self._build_prediction(symbol, timeframe, features, direction, confidence)
+    
+    def _vote_numpy(self, features: Dict) -> Tuple[str, float]:
+        """Direction/confidence from the full indicator set"""
+        directions, confidences = self._combine_signals(
+            features.get("rsi", 50),
+            features.get("momentum_24", 0),
+            features.get("momentum_10", 0),
+            features.get("macd", 0),
+            features.get("volume_ratio", 1)
+        )
+        return str(directions[0]), float(confidences[0])
+    
+    def _vote_fallback(self, features: Dict) -> Tuple[str, float]:
+        """Direction/confidence from momentum alone (no numpy)"""
+        momentum = features.get("momentum_10", 0)
+        if momentum > 1:
+            return "UP", 60
+        if momentum < -1:
+            return "DOWN", 60
+        return "SIDEWAYS", 50.0
+    
+    @staticmethod
+    def _combine_signals(rsi, momentum, momentum_10, macd, volume_ratio) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Vote the indicator signals into (direction, confidence) arrays.
         
-        else:
-            # Fallback prediction
-            momentum = features.get("momentum_10", 0)
-            if momentum > 1:
-                direction = "UP"
-                confidence = 60
-            elif momentum < -1:
-                direction = "DOWN"
-                confidence = 60
+        Takes scalars or equal-length arrays (one entry per symbol) and
+        evaluates every rule as one array expression - no per-symbol branching.
+        """
+        rsi, momentum, momentum_10, macd, volume_ratio = (
+            np.atleast_1d(np.asarray(x, dtype=float))
+            for x in (rsi, momentum, momentum_10, macd, volume_ratio)
+        )
+        bullish_macd = macd > 0
+        
+        # Oversold/overbought RSI and strong momentum count double
+        up = 2 * (rsi < 30) + 2 * (momentum > 2) + (momentum_10 > momentum) + bullish_macd
+        down = 2 * (rsi > 70) + 2 * (momentum < -2) + (momentum_10 < momentum) + ~bullish_macd
+        
+        # High volume confirms whichever side is already ahead
+        high_volume = volume_ratio > 1.5
+        up, down = up + (high_volume & (up > down)), down + (high_volume & (down > up))
         
+        lead = up - down
+        margin = np.abs(lead)
+        direction = np.where(lead > 1, "UP", np.where(lead < -1, "DOWN", "SIDEWAYS"))
+        confidence = np.where(margin > 1, np.minimum(50 + margin * 10, 95), 50 + margin * 5).astype(float)
+        return direction, confidence
+    
+    def _build_prediction(self, symbol: str, timeframe: str, features: Dict,
+                          direction: str, confidence: float,
+                          timestamp: Optional[str] = None) -> Prediction:
+        """Wrap a direction/confidence call into a Prediction"""
         # Calculate predicted price
         current_price = features.get("current_price", 0)
         
@@ -417,24 +697,127 @@ class MLPredictionSystem:
             price_now=current_price,
             price_predicted=predicted_price,
             timeframe=timeframe,
-            features_used=list(features.keys())[:10],  # Top 10 features
+            features_used=self._feature_names,
             model_accuracy=model_accuracy,
-            timestamp=datetime.now(timezone.utc).isoformat()
+            timestamp=timestamp or datetime.now(timezone.utc).isoformat()
         )
     
-    def predict_batch(self, symbols: List[str]) -> List[Prediction]:
-        """Make predictions for multiple symbols"""
-        predictions = []
+    def predict_batch(self, symbols: List[str], timeframe: str = "24h") -> List[Prediction]:
+        """
+        Make predictions for multiple symbols.
+        
+        Histories are fetched concurrently (the fetch is network-bound) and
+        features for the whole batch are computed as one 2-D numpy pass.
+        """
+        if not symbols:
+            return []
+        
+        logger.info(f"[ML] Generating predictions for {len(symbols)} symbols")
+        hours = self._hours_for(timeframe)
         
-        for symbol in symbols:
+        def fetch(symbol):
             try:
-                pred = self.predict(symbol)
-                predictions.append(pred)
+                return self.fetch_price_history(symbol, hours)
+            except Exception as e:
+                logger.error(f"[ML] Prediction error for {symbol}: {e}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=min(16, len(symbols)), thread_name_prefix="ml-fetch") as ex:
+            histories = list(ex.map(fetch, symbols))
+        
+        if HAS_NUMPY:
+            # Repeated symbols share one cached series - compute it once
+            pending = {id(h): h for h in histories if isinstance(h, PriceSeries) and h.features is None}
+            if pending:
+                self._batch_features(list(pending.values()))
+        
+        # Vote every featurized symbol in one vectorized pass
+        voted = {}
+        featurized = [i for i, h in enumerate(histories) if isinstance(h, PriceSeries) and h.features]
+        if featurized:
+            columns = [
+                [histories[i].features.get(name, default) for i in featurized]
+                for name, default in (("rsi", 50), ("momentum_24", 0), ("momentum_10", 0),
+                                      ("macd", 0), ("volume_ratio", 1))
+            ]
+            directions, confidences = self._combine_signals(*columns)
+            voted = {i: (str(d), float(c)) for i, d, c in zip(featurized, directions, confidences)}
+        
+        # One clock read stamps the whole batch
+        now_iso = datetime.now(timezone.utc).isoformat()
+        predictions = []
+        for i, (symbol, data) in enumerate(zip(symbols, histories)):
+            if data is None:
+                continue
+            try:
+                if i in voted:
+                    predictions.append(self._build_prediction(symbol, timeframe, data.features, *voted[i], now_iso))
+                else:
+                    predictions.append(self._predict_from_history(symbol, timeframe, data))
             except Exception as e:
                 logger.error(f"[ML] Prediction error for {symbol}: {e}")
         
         return predictions
-
+    
+    def _batch_features(self, batch: List[PriceSeries]):
+        """Fill in .features for each series, one vectorized pass per history length"""
+        by_length: Dict[int, List[PriceSeries]] = {}
+        for series in batch:
+            if len(series):
+                by_length.setdefault(len(series), []).append(series)
+        
+        for group in by_length.values():
+            columns = self._feature_columns(
+                np.vstack([s.close for s in group]),
+                np.vstack([s.volume for s in group])
+            )
+            for i, series in enumerate(group):
+                series.features = {name: float(col[i]) for name, col in columns.items()}
+    
+    @staticmethod
+    def _feature_columns(closes: "np.ndarray", volumes: "np.ndarray") -> Dict[str, "np.ndarray"]:
+        """calculate_features over a (symbols, hours) matrix; one array per feature"""
+        rows, n = closes.shape
+        last = closes[:, -1]
+        zeros = np.zeros(rows)
+        features = {}
+        
+        tail = closes[:, -50:]
+        w20 = tail[:, -20:]
+        
+        features["sma_20"] = w20.mean(axis=1) if n >= 20 else last
+        features["sma_50"] = tail.mean(axis=1) if n >= 50 else features["sma_20"]
+        
+        features["rsi"] = _rsi_last_rows(closes, 14)
+        
+        if n >= 26:
+            macd_line = _ema_rows(closes, 2 / 13) - _ema_rows(closes, 2 / 27)
+            features["macd"] = macd_line[:, -1]
+            features["macd_signal"] = _ema_rows(macd_line[:, 25:], 2 / 10)[:, -1]
+        else:
+            features["macd"] = zeros
+            features["macd_signal"] = zeros
+        
+        std = w20.std(axis=1)
+        features["bb_upper"] = features["sma_20"] + 2 * std
+        features["bb_lower"] = features["sma_20"] - 2 * std
+        features["bb_position"] = (last - features["bb_lower"]) / (features["bb_upper"] - features["bb_lower"]) * 100
+        
+        features["momentum_10"] = (last - closes[:, -10]) / closes[:, -10] * 100 if n >= 10 else zeros
+        features["momentum_24"] = (last - closes[:, -24]) / closes[:, -24] * 100 if n >= 24 else zeros
+        
+        volume_sma = volumes[:, -20:].mean(axis=1)
+        features["volume_sma"] = volume_sma
+        features["volume_ratio"] = np.divide(volumes[:, -1], volume_sma, out=np.ones(rows), where=volume_sma > 0)
+        
+        if n >= 50:
+            low = tail.min(axis=1)
+            features["price_position"] = (last - low) / (tail.max(axis=1) - low) * 100
+        else:
+            features["price_position"] = np.full(rows, 50.0)
+        
+        features["current_price"] = last
+        return features
 
 def main():
     """CLI entry point"""
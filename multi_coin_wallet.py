@@ -15,13 +15,22 @@ Provides unified interface for:
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Tuple
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 import json
 import os
+import threading
+import time
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class TokenBalance:
     """Represents a token balance"""
     symbol: str
@@ -36,34 +45,64 @@ class TokenBalance:
         return 0.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WalletInfo:
     """Wallet information for a specific chain"""
     chain: str
     address: Optional[str]
     connected: bool
     balances: List[TokenBalance]
+    # Column copies of balance / price (missing prices as 0) for total_value_usd
+    _amounts: Any = field(default=None, init=False, repr=False, compare=False)
+    _prices: Any = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if HAS_NUMPY:
+            # Frozen dataclass: derived fields are set once, here
+            object.__setattr__(self, "_amounts", np.fromiter(
+                (b.balance for b in self.balances), dtype=np.float64, count=len(self.balances)))
+            object.__setattr__(self, "_prices", np.fromiter(
+                (b.price_usd or 0.0 for b in self.balances), dtype=np.float64, count=len(self.balances)))
     
     @property
     def total_value_usd(self) -> float:
+        if self._amounts is not None:
+            return float(self._amounts @ self._prices)
         return sum(b.value_usd for b in self.balances)
 
 
 class BaseWallet(ABC):
     """Abstract base class for all wallet implementations"""
     
+    # Seconds a balance snapshot is served before the chain is queried again
+    BALANCE_TTL = 5.0
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.enabled = config.get("enabled", False)
+        self._snapshot: Optional[Tuple[TokenBalance, ...]] = None
+        self._snapshot_ts = 0.0
     
     @abstractmethod
     def get_address(self) -> Optional[str]:
         """Get wallet address"""
         pass
     
-    @abstractmethod
     def get_balances(self) -> List[TokenBalance]:
-        """Get all token balances"""
+        """Get all token balances (snapshot reused for BALANCE_TTL seconds)"""
+        if self._snapshot is None or time.monotonic() - self._snapshot_ts >= self.BALANCE_TTL:
+            self._snapshot = tuple(self._fetch_balances())
+            self._snapshot_ts = time.monotonic()
+        # Fresh list per call - callers may append/sort without touching the cache
+        return list(self._snapshot)
+    
+    def invalidate_balances(self):
+        """Drop the balance snapshot so the next read hits the chain"""
+        self._snapshot = None
+    
+    @abstractmethod
+    def _fetch_balances(self) -> List[TokenBalance]:
+        """Fetch all token balances from the chain"""
         pass
     
     @abstractmethod
@@ -76,9 +115,17 @@ class BaseWallet(ABC):
         """Check if wallet is connected and ready"""
         pass
     
-    @abstractmethod
     def send_transaction(self, to: str, amount: float, token: str) -> Optional[str]:
         """Send a transaction, returns tx hash or None"""
+        tx_hash = self._send_transaction(to, amount, token)
+        if tx_hash:
+            # Balances just changed on-chain
+            self.invalidate_balances()
+        return tx_hash
+    
+    @abstractmethod
+    def _send_transaction(self, to: str, amount: float, token: str) -> Optional[str]:
+        """Chain-specific send; returns tx hash or None"""
         pass
 
 
@@ -168,7 +215,7 @@ class SolanaWallet(BaseWallet):
     def get_address(self) -> Optional[str]:
         return self._address
     
-    def get_balances(self) -> List[TokenBalance]:
+    def _fetch_balances(self) -> List[TokenBalance]:
         """Fetch all token balances from blockchain"""
         balances = []
         
@@ -208,7 +255,7 @@ class SolanaWallet(BaseWallet):
     def is_connected(self) -> bool:
         return self._address is not None
     
-    def send_transaction(self, to: str, amount: float, token: str) -> Optional[str]:
+    def _send_transaction(self, to: str, amount: float, token: str) -> Optional[str]:
         """Send a transaction - requires private key"""
         print(f"[SolanaWallet] Transaction signing not implemented in this version")
         print(f"[SolanaWallet] Would send {amount} {token} to {to}")
@@ -227,7 +274,7 @@ class EthereumWallet(BaseWallet):
     def get_address(self) -> Optional[str]:
         return self._address
     
-    def get_balances(self) -> List[TokenBalance]:
+    def _fetch_balances(self) -> List[TokenBalance]:
         # Would use web3.py to fetch real balances
         return [
             TokenBalance("ETH", 0.0, 18),
@@ -240,7 +287,7 @@ class EthereumWallet(BaseWallet):
     def is_connected(self) -> bool:
         return self._address is not None and self.rpc_url != ""
     
-    def send_transaction(self, to: str, amount: float, token: str) -> Optional[str]:
+    def _send_transaction(self, to: str, amount: float, token: str) -> Optional[str]:
         print(f"[EthereumWallet] Would send {amount} {token} to {to}")
         return None
 
@@ -256,7 +303,7 @@ class BSCWallet(BaseWallet):
     def get_address(self) -> Optional[str]:
         return self._address
     
-    def get_balances(self) -> List[TokenBalance]:
+    def _fetch_balances(self) -> List[TokenBalance]:
         return [
             TokenBalance("BNB", 0.0, 18),
             TokenBalance("USDT", 0.0, 18),
@@ -268,7 +315,7 @@ class BSCWallet(BaseWallet):
     def is_connected(self) -> bool:
         return self._address is not None
     
-    def send_transaction(self, to: str, amount: float, token: str) -> Optional[str]:
+    def _send_transaction(self, to: str, amount: float, token: str) -> Optional[str]:
         print(f"[BSCWallet] Would send {amount} {token} to {to}")
         return None
 
@@ -285,9 +332,8 @@ class MultiCoinWalletManager:
     def _load_config(self):
         """Load wallet configuration"""
         try:
-            with open(self.config_path, "r") as f:
-                config = json.load(f)
-                self.wallet_config = config.get("wallets", {})
+            config = _load_config_cached(self.config_path, os.stat(self.config_path).st_mtime_ns)
+            self.wallet_config = config.get("wallets", {})
         except:
             self.wallet_config = {
                 "solana": {"enabled": True, "supported_tokens": ["SOL", "USDC", "USDT"]},
@@ -297,6 +343,8 @@ class MultiCoinWalletManager:
     
     def _init_wallets(self):
         """Initialize enabled wallets"""
+        # Wallet set is being rebuilt - recompute the primary address on next read
+        self.__dict__.pop("primary_address", None)
         for chain, config in self.wallet_config.items():
             if not config.get("enabled", False):
                 continue
@@ -340,6 +388,11 @@ class MultiCoinWalletManager:
     
     def get_primary_address(self) -> Optional[str]:
         """Get primary wallet address (Solana first)"""
+        return self.primary_address
+    
+    @cached_property
+    def primary_address(self) -> Optional[str]:
+        """Primary wallet address, resolved once per wallet set (Solana first)"""
         # Prefer Solana
         if "solana" in self.wallets:
             addr = self.wallets["solana"].get_address()
@@ -382,9 +435,25 @@ class MultiCoinWalletManager:
         }
 
 
+@lru_cache(maxsize=1)
+def _load_config_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a config file; keyed on mtime so an edited file is re-read"""
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+_manager: Optional[MultiCoinWalletManager] = None
+_manager_lock = threading.Lock()
+
+
 def get_wallet_manager() -> MultiCoinWalletManager:
     """Get singleton wallet manager instance"""
-    return MultiCoinWalletManager()
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = MultiCoinWalletManager()
+    return _manager
 
 
 if __name__ == "__main__":
@@ -16,9 +16,11 @@ Usage:
 """
 
 import os
+import re
 import json
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
@@ -44,6 +46,36 @@ except ImportError:
 class CryptoNewsFetcher:
     """Fetch crypto news from free sources with sentiment"""
     
+    # Sentiment lexicon, matched against whole headline tokens
+    # Whole tokens, so inflected forms are listed alongside each stem
+    _BULLISH = frozenset([
+        "up", "rise", "gain", "bull", "rally", "surge", "positive",
+        "soar", "jump", "boost", "growth", "record", "high", "win",
+        "breakout", "momentum", "optimistic", "bullish", "moon", "hodl",
+        "all-time", "peak", "approve", "adoption", "partnership", "launch",
+        "rises", "rising", "rose", "gains", "gained", "bulls", "rallies",
+        "rallied", "rallying", "surges", "surged", "surging", "soars",
+        "soared", "soaring", "jumps", "jumped", "boosts", "boosted",
+        "records", "highs", "wins", "breakouts", "peaks", "peaked",
+        "approves", "approved", "approval", "partnerships", "launches",
+        "launched"
+    ])
+    _BEARISH = frozenset([
+        "down", "fall", "loss", "bear", "crash", "drop", "negative",
+        "plunge", "sink", "slump", "decline", "low", "fail", "risk",
+        "breakdown", "fear", "pessimist", "bearish", "ban", "hack",
+        "scam", "warning", "crackdown", "regulate", "selloff", "reject",
+        "falls", "fell", "falling", "losses", "bears", "crashes", "crashed",
+        "crashing", "drops", "dropped", "plunges", "plunged", "plunging",
+        "sinks", "sank", "slumps", "slumped", "declines", "declined",
+        "declining", "lows", "fails", "failed", "failure", "risks", "fears",
+        "pessimism", "pessimistic", "bans", "banned", "hacks", "hacked",
+        "scams", "warnings", "warns", "crackdowns", "regulated",
+        "regulation", "regulations", "regulators", "regulatory",
+        "selloffs", "sell-off", "rejects", "rejected", "rejection"
+    ])
+    _TOKEN_RE = re.compile(r"[a-z\-]+")
+    
     def __init__(self):
         self.session = requests.Session() if requests else None
     
@@ -107,9 +139,14 @@ class CryptoNewsFetcher:
         
         articles = []
         
-        for source_name, feed_url in rss_feeds:
+        # Feed downloads are pure network waits - fetch them all at once,
+        # then process in the listed order so results stay deterministic
+        with ThreadPoolExecutor(max_workers=len(rss_feeds), thread_name_prefix="rss") as ex:
+            futures = [(name, ex.submit(feedparser.parse, url)) for name, url in rss_feeds]
+        
+        for source_name, future in futures:
             try:
-                feed = feedparser.parse(feed_url)
+                feed = future.result()
                 
                 for entry in feed.entries[:limit // len(rss_feeds)]:
                     title = entry.get("title", "")
@@ -150,12 +187,16 @@ class CryptoNewsFetcher:
         """
         all_articles = []
         
-        # Try CryptoPanic first
-        cp_articles = self.fetch_cryptopanic(keywords, limit)
-        all_articles.extend(cp_articles)
+        # The sources are independent network calls - run them side by side
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="news") as ex:
+            cp_future = ex.submit(self.fetch_cryptopanic, keywords, limit)
+            rss_future = ex.submit(self.fetch_rss, keywords, limit)
+        
+        # CryptoPanic first
+        all_articles.extend(cp_future.result())
         
         # Add RSS feeds
-        rss_articles = self.fetch_rss(keywords, limit)
+        rss_articles = rss_future.result()
         
         # Avoid duplicates
         existing_titles = {a["title"] for a in all_articles}
@@ -171,23 +212,11 @@ class CryptoNewsFetcher:
         
         Returns: float between -1 (bearish) and +1 (bullish)
         """
-        bullish_terms = [
-            "up", "rise", "gain", "bull", "rally", "surge", "positive",
-            "soar", "jump", "boost", "growth", "record", "high", "win",
-            "breakout", "momentum", "optimistic", "bullish", "moon", "hodl",
-            "all-time", "peak", "approve", "adoption", "partnership", "launch"
-        ]
-        bearish_terms = [
-            "down", "fall", "loss", "bear", "crash", "drop", "negative",
-            "plunge", "sink", "slump", "decline", "low", "fail", "risk",
-            "breakdown", "fear", "pessimist", "bearish", "ban", "hack",
-            "scam", "warning", "crackdown", "regulate", "selloff", "reject"
-        ]
-        
-        text_lower = text.lower()
+        tokens = self._TOKEN_RE.findall(text.lower())
         
-        bullish_count = sum(1 for term in bullish_terms if term in text_lower)
-        bearish_count = sum(1 for term in bearish_terms if term in text_lower)
+        # Whole-word matches: "up" no longer fires on "supply", nor "ban" on "banking"
+        bullish_count = sum(1 for t in tokens if t in self._BULLISH)
+        bearish_count = sum(1 for t in tokens if t in self._BEARISH)
         
         if bullish_count > bearish_count:
             return min(0.5 + (bullish_count * 0.1), 1.0)
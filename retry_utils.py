@@ -7,8 +7,11 @@ For resilient API calls to exchanges
 import time
 import random
 import logging
+import threading
 from functools import wraps
 from typing import Callable, TypeVar, Optional, Tuple, List
+import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, Timeout, ConnectionError
 
 T = TypeVar('T')
@@ -135,6 +138,7 @@ class CircuitBreaker:
         
         self.failure_count = 0
         self.last_failure_time = None
+        self.last_probe_time = None
         self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
         self.half_open_calls = 0
     
@@ -149,20 +153,45 @@ class CircuitBreaker:
                (time.time() - self.last_failure_time) >= self.recovery_timeout:
                 logger.info("Circuit breaker entering HALF_OPEN state")
                 self.state = "HALF_OPEN"
-                self.half_open_calls = 0
+                self.half_open_calls = 1
+                self.last_probe_time = time.time()
                 return True
             
             logger.warning("Circuit breaker is OPEN - failing fast")
             return False
         
         if self.state == "HALF_OPEN":
+            # Probe budget exhausted without a verdict: allow a fresh probe
+            # once per recovery_timeout so the breaker cannot wedge here
+            if self.half_open_calls >= self.half_open_max_calls and \
+               self.last_probe_time and \
+               (time.time() - self.last_probe_time) >= self.recovery_timeout:
+                self.half_open_calls = 0
+            
             if self.half_open_calls < self.half_open_max_calls:
                 self.half_open_calls += 1
+                self.last_probe_time = time.time()
                 return True
             return False
         
         return True
     
+    def would_execute(self) -> bool:
+        """Like can_execute(), but only peeks: no state change, no probe claimed."""
+        now = time.time()
+        if self.state == "OPEN":
+            return bool(self.last_failure_time) and \
+                (now - self.last_failure_time) >= self.recovery_timeout
+        if self.state == "HALF_OPEN":
+            return self.half_open_calls < self.half_open_max_calls or \
+                bool(self.last_probe_time and (now - self.last_probe_time) >= self.recovery_timeout)
+        return True
+    
+    def release_probe(self):
+        """Hand back a HALF_OPEN probe slot claimed for a call that was never made."""
+        if self.state == "HALF_OPEN" and self.half_open_calls > 0:
+            self.half_open_calls -= 1
+    
     def record_success(self):
         """Record a successful execution."""
         if self.state == "HALF_OPEN":
@@ -203,6 +232,85 @@ class CircuitBreaker:
         return wrapper
 
 
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+    
+    One bucket is shared by every caller of an API so that separate
+    client instances cannot collectively exceed the venue's limit.
+    """
+    
+    __slots__ = ("capacity", "tokens", "rate", "last", "_lock")
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (defaults to one second of tokens)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.tokens = self.capacity
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, tokens: float = 1.0):
+        """Block until `tokens` are available, then consume them."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# Published REST request limits (requests/second) per exchange
+EXCHANGE_RATE_LIMITS = {
+    "binance": 20.0,   # 1200 weight/min
+    "kraken": 15.0,
+    "coinbase": 10.0,
+    "jupiter": 10.0,
+}
+DEFAULT_RATE_LIMIT = 10.0
+
+_rate_limiters: dict = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(exchange: str) -> TokenBucket:
+    """Get the process-wide token bucket for an exchange."""
+    name = exchange.lower()
+    bucket = _rate_limiters.get(name)
+    if bucket is None:
+        with _rate_limiters_lock:
+            bucket = _rate_limiters.get(name)
+            if bucket is None:
+                bucket = TokenBucket(EXCHANGE_RATE_LIMITS.get(name, DEFAULT_RATE_LIMIT))
+                _rate_limiters[name] = bucket
+    return bucket
+
+
+def pooled_session(pool_size: int = 20) -> requests.Session:
+    """
+    Create a keep-alive requests.Session with a sized connection pool.
+    
+    Reusing pooled connections skips the TCP + TLS handshake on every
+    request after the first.
+    
+    Args:
+        pool_size: Connections kept per host
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=1)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 # Pre-configured retry settings for different scenarios
 RETRY_FAST = RetryConfig(max_retries=3, base_delay=0.5, max_delay=5.0)
 RETRY_STANDARD = RetryConfig(max_retries=3, base_delay=1.0, max_delay=30.0)
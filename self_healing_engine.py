@@ -19,19 +19,42 @@ Usage:
 import asyncio
 import json
 import logging
+import os
+import shutil
 import sqlite3
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Dict, List, Optional, Any, Callable, Tuple
 from pathlib import Path
 
+import requests
+
+from retry_utils import pooled_session
 from zeroclaw_integration import ZeroClawIntegration
 
+try:
+    import psutil
+    HAS_PSUTIL = True
+except ImportError:
+    HAS_PSUTIL = False
+
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
 logger = logging.getLogger(__name__)
 
+# procfs unit conversions, queried once - sysconf can be a syscall
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+_CLK_TCK = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+
 
 class IssueType(Enum):
     """Types of issues that can be detected."""
@@ -84,6 +107,15 @@ class DetectedIssue:
     escalation_count: int = 0
 
 
+def _meminfo_field(buf: bytes, key: bytes) -> int:
+    """Extract one /proc/meminfo field in bytes, or 0 if it is missing."""
+    i = buf.find(key)
+    if i < 0:
+        return 0
+    j = buf.find(b'\n', i + len(key))
+    return int(buf[i + len(key):j].split()[0]) * 1024
+
+
 class SelfHealingEngine:
     """
     Autonomous self-healing system for the trading bot.
@@ -104,6 +136,40 @@ class SelfHealingEngine:
         'slow': 60       # Non-critical checks
     }
     
+    # Resource usage thresholds (warn %, critical %)
+    MEMORY_THRESHOLDS = (75, 90)
+    DISK_THRESHOLDS = (75, 90)
+    
+    # Public REST endpoints probed for exchange connectivity
+    EXCHANGE_HEALTH_URLS = {
+        'binance': 'https://api.binance.com/api/v3/ping',
+        'coinbase': 'https://api.coinbase.com/v2/exchange-rates?currency=BTC',
+        'kraken': 'https://api.kraken.com/0/public/SystemStatus',
+        'kucoin': 'https://api.kucoin.com/api/v1/timestamp',
+        'bybit': 'https://api.bybit.com/v5/market/time'
+    }
+    
+    # Per-request timeout and wall-clock cap for a whole probe round (seconds)
+    EXCHANGE_PROBE_TIMEOUT = 5
+    EXCHANGE_PROBE_DEADLINE = 8
+    
+    # Probes only need a response: ask for headers, skip compression. Any
+    # HTTP status counts as reachable (geo-blocks answer 403/451, some
+    # endpoints reject HEAD) - only connect/timeout errors mark a venue down.
+    PROBE_HEADERS = {'Accept-Encoding': 'identity'}
+    
+    # How long health report entries may be served from cache (seconds)
+    REPORT_CACHE_TTLS = {
+        'memory': 5,
+        'disk': 5,
+        'database': 5,
+        'database_detailed': 60,
+        'bot_process': 5
+    }
+    
+    # Exchange probes are slow, so reports read them from a background refresh
+    EXCHANGE_REFRESH_INTERVAL = 30
+    
     # Remediation playbook - maps issues to actions
     REMEDIATION_PLAYBOOK = {
         IssueType.ZEROCLAW_DOWN.value: [
@@ -153,6 +219,35 @@ class SelfHealingEngine:
         self.health_cache: Dict[str, Any] = {}
         self.last_check: Dict[str, float] = {}
         
+        # TTL cache for on-demand health reports: name -> (monotonic ts, result)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        self._cache_locks: Dict[str, threading.Lock] = {
+            name: threading.Lock() for name in self.REPORT_CACHE_TTLS
+        }
+        
+        # Directory holding trades.db, resolved once for disk checks
+        self._data_dir = os.path.dirname(os.path.abspath('trades.db'))
+        
+        # Background exchange refresh timer, started by the first health report
+        self._exchange_timer: Optional[threading.Timer] = None
+        self._exchange_timer_lock = threading.Lock()
+        
+        # Shared connection to the trades database, opened on first use
+        self._db_conn: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        
+        # Previous (cpu seconds, monotonic ts) per PID for non-blocking CPU %
+        self._cpu_state: Dict[int, Tuple[float, float]] = {}
+        
+        # Open /proc/<pid>/stat and statm fds, reused across polls
+        self._proc_fds: Dict[int, Tuple[int, int]] = {}
+        
+        # Keep-alive session so repeated probes reuse TCP/TLS connections
+        self._session: requests.Session = pooled_session(pool_size=8)
+        
+        # aiohttp session for the async probe path, created inside the loop
+        self._aio_session: Optional['aiohttp.ClientSession'] = None
+        
         # Callbacks
         self.on_issue: Optional[Callable[[DetectedIssue], None]] = None
         self.on_resolution: Optional[Callable[[DetectedIssue], None]] = None
@@ -265,11 +360,22 @@ class SelfHealingEngine:
                 logger.error(f"[SelfHealingEngine] Cycle error: {e}")
                 await asyncio.sleep(5)
         
+        if self._aio_session is not None:
+            await self._aio_session.close()
+            self._aio_session = None
+        
         logger.info("[SelfHealingEngine] Stopped")
     
     def stop(self):
         """Stop the self-healing engine."""
         self.running = False
+        self._session.close()
+        self._close_trades_db()
+        self._close_proc_fds()
+        with self._exchange_timer_lock:
+            if self._exchange_timer is not None:
+                self._exchange_timer.cancel()
+                self._exchange_timer = None
     
     def toggle(self, enabled: bool):
         """Enable or disable self-healing with proper event loop handling."""
@@ -289,10 +395,12 @@ class SelfHealingEngine:
     async def _run_health_check_cycle(self):
         """Execute one complete health check cycle."""
         now = time.time()
+        # One timestamp shared by every issue raised in this cycle
+        ts = datetime.now(timezone.utc).isoformat()
         
         # 1. Check ZeroClaw gateway
         if self._should_check('zeroclaw', now):
-            await self._check_zeroclaw_health()
+            await self._check_zeroclaw_health(ts)
         
         # 2. Check WebSocket connections
         if self._should_check('websocket', now):
@@ -300,17 +408,21 @@ class SelfHealingEngine:
         
         # 3. Check database
         if self._should_check('database', now):
-            await self._check_database_health()
+            await self._check_database_health(ts)
         
         # 4. Check system resources
         if self._should_check('system', now):
-            await self._check_system_resources()
+            await self._check_system_resources(ts)
         
         # 5. Check trading health
         if self._should_check('trading', now):
-            await self._check_trading_health()
+            await self._check_trading_health(ts)
         
-        # 6. Process any new issues
+        # 6. Check exchange API connectivity
+        if self._should_check('api', now):
+            await self._check_api_connectivity(ts)
+        
+        # 7. Process any new issues
         await self._process_issues()
     
     def _should_check(self, component: str, now: float) -> bool:
@@ -324,7 +436,7 @@ class SelfHealingEngine:
         
         return now - last_check >= interval
     
-    async def _check_zeroclaw_health(self):
+    async def _check_zeroclaw_health(self, ts: Optional[str] = None):
         """Check ZeroClaw gateway health."""
         self.last_check['zeroclaw'] = time.time()
         
@@ -334,7 +446,7 @@ class SelfHealingEngine:
             if not is_running:
                 issue = DetectedIssue(
                     issue_id=f"zeroclaw_down_{int(time.time())}",
-                    timestamp=datetime.now(timezone.utc).isoformat(),
+                    timestamp=ts or datetime.now(timezone.utc).isoformat(),
                     issue_type=IssueType.ZEROCLAW_DOWN.value,
                     description="ZeroClaw gateway is not responding",
                     severity='high',
@@ -357,24 +469,23 @@ class SelfHealingEngine:
         # For now, placeholder
         pass
     
-    async def _check_database_health(self):
+    async def _check_database_health(self, ts: Optional[str] = None):
         """Check database health."""
         self.last_check['database'] = time.time()
         
         try:
-            conn = sqlite3.connect('trades.db', timeout=5)
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM trades")
-            cursor.fetchone()
-            conn.close()
+            # schema_version only reads the header page - no table scan
+            with self._db_lock:
+                self._trades_db().execute("PRAGMA schema_version").fetchone()
             
             # Clear any existing DB issues
             await self._clear_resolved_issues(IssueType.DATABASE_ERROR.value)
             
         except Exception as e:
+            self._close_trades_db()
             issue = DetectedIssue(
                 issue_id=f"db_error_{int(time.time())}",
-                timestamp=datetime.now(timezone.utc).isoformat(),
+                timestamp=ts or datetime.now(timezone.utc).isoformat(),
                 issue_type=IssueType.DATABASE_ERROR.value,
                 description=f"Database connection error: {str(e)[:100]}",
                 severity='critical',
@@ -383,17 +494,17 @@ class SelfHealingEngine:
             )
             await self._register_issue(issue)
     
-    async def _check_system_resources(self):
+    async def _check_system_resources(self, ts: Optional[str] = None):
         """Check system resource usage."""
         self.last_check['system'] = time.time()
         
         try:
             # Check memory usage
             mem_info = self._get_memory_usage()
-            if mem_info.get('percent', 0) > 90:
+            if mem_info.get('status') == 'critical':
                 issue = DetectedIssue(
                     issue_id=f"memory_high_{int(time.time())}",
-                    timestamp=datetime.now(timezone.utc).isoformat(),
+                    timestamp=ts or datetime.now(timezone.utc).isoformat(),
                     issue_type=IssueType.MEMORY_HIGH.value,
                     description=f"High memory usage: {mem_info['percent']}%",
                     severity='medium',
@@ -404,10 +515,10 @@ class SelfHealingEngine:
             
             # Check disk usage
             disk_info = self._get_disk_usage()
-            if disk_info.get('percent', 0) > 90:
+            if disk_info.get('status') == 'critical':
                 issue = DetectedIssue(
                     issue_id=f"disk_full_{int(time.time())}",
-                    timestamp=datetime.now(timezone.utc).isoformat(),
+                    timestamp=ts or datetime.now(timezone.utc).isoformat(),
                     issue_type=IssueType.DISK_FULL.value,
                     description=f"Low disk space: {disk_info['percent']}% used",
                     severity='high',
@@ -419,28 +530,27 @@ class SelfHealingEngine:
         except Exception as e:
             logger.warning(f"[SelfHealingEngine] Resource check failed: {e}")
     
-    async def _check_trading_health(self):
+    async def _check_trading_health(self, ts: Optional[str] = None):
         """Check trading system health."""
         self.last_check['trading'] = time.time()
         
         try:
             # Check recent trade execution failures
-            conn = sqlite3.connect('trades.db')
-            cursor = conn.cursor()
-            
-            # Get failed trades in last hour
-            cursor.execute("""
-                SELECT COUNT(*) FROM trades 
-                WHERE status = 'FAILED' 
-                AND timestamp > datetime('now', '-1 hour')
-            """)
-            failed_count = cursor.fetchone()[0]
-            conn.close()
+            with self._db_lock:
+                cursor = self._trades_db().cursor()
+                
+                # Get failed trades in last hour
+                cursor.execute("""
+                    SELECT COUNT(*) FROM trades 
+                    WHERE status = 'FAILED' 
+                    AND timestamp > datetime('now', '-1 hour')
+                """)
+                failed_count = cursor.fetchone()[0]
             
             if failed_count > 5:
                 issue = DetectedIssue(
                     issue_id=f"trade_failures_{int(time.time())}",
-                    timestamp=datetime.now(timezone.utc).isoformat(),
+                    timestamp=ts or datetime.now(timezone.utc).isoformat(),
                     issue_type=IssueType.TRADE_EXECUTION_FAILURE.value,
                     description=f"High trade failure rate: {failed_count} failures in last hour",
                     severity='high',
@@ -452,21 +562,298 @@ class SelfHealingEngine:
         except Exception as e:
             logger.warning(f"[SelfHealingEngine] Trading check failed: {e}")
     
-    def _get_memory_usage(self) -> Dict[str, float]:
-        """Get current memory usage."""
+    async def _check_api_connectivity(self, ts: Optional[str] = None):
+        """Check exchange REST API reachability."""
+        self.last_check['api'] = time.time()
+        
+        try:
+            if HAS_AIOHTTP:
+                results = await self._aprobe_exchanges()
+            else:
+                loop = asyncio.get_running_loop()
+                results = await loop.run_in_executor(None, self._probe_exchanges)
+            self.health_cache['exchanges'] = results
+            self._cache['exchanges'] = (time.monotonic(), results)
+            
+            down = [name for name, r in results.items() if not r['reachable']]
+            if down:
+                issue = DetectedIssue(
+                    issue_id=f"api_down_{int(time.time())}",
+                    timestamp=ts or datetime.now(timezone.utc).isoformat(),
+                    issue_type=IssueType.API_CONNECTIVITY.value,
+                    description=f"Exchange APIs unreachable: {', '.join(sorted(down))}",
+                    severity='high' if len(down) == len(results) else 'medium',
+                    metrics=results,
+                    status=IssueStatus.DETECTED.value
+                )
+                await self._register_issue(issue)
+            else:
+                await self._clear_resolved_issues(IssueType.API_CONNECTIVITY.value)
+                
+        except Exception as e:
+            logger.warning(f"[SelfHealingEngine] API connectivity check failed: {e}")
+    
+    async def _aprobe_exchanges(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Probe every exchange endpoint on the event loop with aiohttp.
+        
+        Same result shape and deadline as _probe_exchanges, but without a
+        thread per socket.
+        """
+        if self._aio_session is None or self._aio_session.closed:
+            self._aio_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=self.EXCHANGE_PROBE_TIMEOUT)
+            )
+        session = self._aio_session
+        
+        async def probe(url: str) -> Dict[str, Any]:
+            start = time.perf_counter()
+            async with session.head(url, headers=self.PROBE_HEADERS,
+                                    allow_redirects=False) as resp:
+                status = resp.status
+            return {
+                'reachable': True,
+                'status_code': status,
+                'latency_ms': round((time.perf_counter() - start) * 1000, 1)
+            }
+        
+        tasks = {
+            asyncio.ensure_future(probe(url)): name
+            for name, url in self.EXCHANGE_HEALTH_URLS.items()
+        }
+        done, pending = await asyncio.wait(tasks, timeout=self.EXCHANGE_PROBE_DEADLINE)
+        for task in pending:
+            task.cancel()
+        
+        results = {}
+        for task, name in tasks.items():
+            if task in pending:
+                results[name] = {'reachable': False, 'error': 'timed out'}
+            elif task.exception() is not None:
+                e = task.exception()
+                results[name] = {'reachable': False, 'error': (str(e) or type(e).__name__)[:100]}
+            else:
+                results[name] = task.result()
+        return results
+    
+    def _probe_exchanges(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Probe every exchange endpoint concurrently.
+        
+        Total latency is bounded by the slowest single probe (capped at
+        EXCHANGE_PROBE_DEADLINE) instead of the sum of all of them.
+        """
+        urls = self.EXCHANGE_HEALTH_URLS
+        results = {
+            name: {'reachable': False, 'error': 'timed out'} for name in urls
+        }
+        
+        def probe(url: str) -> Dict[str, Any]:
+            start = time.perf_counter()
+            resp = self._session.head(url, headers=self.PROBE_HEADERS,
+                                      timeout=self.EXCHANGE_PROBE_TIMEOUT,
+                                      allow_redirects=False)
+            return {
+                'reachable': True,
+                'status_code': resp.status_code,
+                'latency_ms': round((time.perf_counter() - start) * 1000, 1)
+            }
+        
+        pool = ThreadPoolExecutor(max_workers=len(urls))
+        futures = {pool.submit(probe, url): name for name, url in urls.items()}
+        try:
+            for future in as_completed(futures, timeout=self.EXCHANGE_PROBE_DEADLINE):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    results[name] = {'reachable': False, 'error': str(e)[:100]}
+        except FuturesTimeout:
+            logger.debug("[SelfHealingEngine] Exchange probe deadline exceeded")
+        finally:
+            # Don't block on stragglers; their requests timeout on their own
+            pool.shutdown(wait=False, cancel_futures=True)
+        
+        return results
+    
+    def _trades_db(self) -> sqlite3.Connection:
+        """Return the shared trades.db connection (caller holds _db_lock)."""
+        if self._db_conn is None:
+            self._db_conn = sqlite3.connect('trades.db', timeout=5, check_same_thread=False)
+        return self._db_conn
+    
+    def _close_trades_db(self):
+        """Drop the shared connection so the next check reconnects."""
+        with self._db_lock:
+            if self._db_conn is not None:
+                try:
+                    self._db_conn.close()
+                except sqlite3.Error:
+                    pass
+                self._db_conn = None
+    
+    def _get_database_stats(self, detailed: bool = False) -> Dict[str, Any]:
+        """
+        Get trades.db health.
+        
+        The default is a header-page liveness read. detailed=True adds a
+        structural quick_check and row counts, which touch every page and
+        are meant for admin views rather than routine polling.
+        """
+        try:
+            with self._db_lock:
+                conn = self._trades_db()
+                conn.execute("PRAGMA schema_version").fetchone()
+                if not detailed:
+                    return {'connected': True}
+                
+                check = conn.execute("PRAGMA quick_check(1)").fetchone()[0]
+                rows = conn.execute("""
+                    SELECT 'trades', COUNT(*) FROM trades
+                    UNION ALL SELECT 'positions', COUNT(*) FROM positions
+                    UNION ALL SELECT 'price_history', COUNT(*) FROM price_history
+                """).fetchall()
+            return {'connected': True, 'integrity': check, 'row_counts': dict(rows)}
+        except Exception as e:
+            logger.debug(f"[SelfHealingEngine] Database stats failed: {e}")
+            return {'connected': False, 'error': str(e)[:100]}
+    
+    def _get_bot_process_stats(self) -> Dict[str, Any]:
+        """
+        Get trading bot process stats from bot.pid.
+        
+        CPU usage is the delta between successive calls rather than a
+        blocking sample, so the first call for a PID reports cpu_percent=None.
+        """
+        try:
+            with open('bot.pid') as f:
+                pid = int(f.read().strip())
+        except (OSError, ValueError):
+            return {'running': False}
+        
+        if not HAS_PSUTIL:
+            return self._read_proc_stats(pid)
+        
         try:
-            # Use /proc/meminfo on Linux
-            with open('/proc/meminfo', 'r') as f:
-                lines = f.readlines()
+            proc = psutil.Process(pid)
+            with proc.oneshot():
+                times = proc.cpu_times()
+                rss = proc.memory_info().rss
+                created = proc.create_time()
+        except psutil.Error:
+            self._cpu_state.pop(pid, None)
+            return {'running': False, 'pid': pid}
+        
+        return {
+            'running': True,
+            'pid': pid,
+            'cpu_percent': self._cpu_delta(pid, times.user + times.system),
+            'memory_rss': rss,
+            'uptime_seconds': int(time.time() - created)
+        }
+    
+    def _read_proc_stats(self, pid: int) -> Dict[str, Any]:
+        """Read process stats straight from procfs (Linux fallback without psutil)."""
+        try:
+            fds = self._proc_fds.get(pid)
+            if fds is None:
+                self._close_proc_fds()
+                stat_fd = os.open(f'/proc/{pid}/stat', os.O_RDONLY)
+                try:
+                    statm_fd = os.open(f'/proc/{pid}/statm', os.O_RDONLY)
+                except OSError:
+                    os.close(stat_fd)
+                    raise
+                fds = self._proc_fds[pid] = (stat_fd, statm_fd)
             
-            mem_total = 0
-            mem_available = 0
+            # procfs regenerates the file on each read, so pread at offset 0
+            # returns a fresh, consistent snapshot without reopening
+            stat = os.pread(fds[0], 512, 0)
+            statm = os.pread(fds[1], 128, 0)
+        except OSError:
+            self._close_proc_fds()
+            self._cpu_state.pop(pid, None)
+            return {'running': False, 'pid': pid}
+        
+        # Skip past "(comm)" - the command name may itself contain spaces
+        fields = stat[stat.rfind(b')') + 2:].split(b' ')
+        ticks = int(fields[11]) + int(fields[12])  # utime + stime
+        cpu_seconds = ticks / _CLK_TCK
+        rss_pages = int(statm.split(b' ', 2)[1])
+        
+        return {
+            'running': True,
+            'pid': pid,
+            'cpu_percent': self._cpu_delta(pid, cpu_seconds),
+            'memory_rss': rss_pages * _PAGE_SIZE
+        }
+    
+    def _close_proc_fds(self):
+        """Close cached procfs fds (PID changed or process exited)."""
+        for fds in self._proc_fds.values():
+            for fd in fds:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._proc_fds.clear()
+    
+    def _cpu_delta(self, pid: int, cpu_seconds: float) -> Optional[float]:
+        """CPU % of pid since the previous sample, normalised by CPU count."""
+        now = time.monotonic()
+        prev = self._cpu_state.get(pid)
+        self._cpu_state[pid] = (cpu_seconds, now)
+        if prev is None or now <= prev[1]:
+            return None
+        ncpus = os.cpu_count() or 1
+        return round((cpu_seconds - prev[0]) / (now - prev[1]) / ncpus * 100, 1)
+    
+    def _cached(self, name: str, fn: Callable[[], Any]) -> Any:
+        """
+        Return fn()'s result, reusing it for REPORT_CACHE_TTLS[name] seconds.
+        
+        Only one caller refills an expired entry; concurrent callers wait on
+        the per-key lock and then read the fresh value instead of re-probing.
+        """
+        ttl = self.REPORT_CACHE_TTLS[name]
+        entry = self._cache.get(name)
+        if entry and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+        
+        with self._cache_locks[name]:
+            entry = self._cache.get(name)
+            if entry and time.monotonic() - entry[0] < ttl:
+                return entry[1]
+            result = fn()
+            self._cache[name] = (time.monotonic(), result)
+            return result
+    
+    @staticmethod
+    def _bucket(percent: float, warn: float, crit: float) -> str:
+        """Map a usage percentage onto healthy / warning / critical."""
+        if percent > crit:
+            return 'critical'
+        return 'warning' if percent > warn else 'healthy'
+    
+    def _get_memory_usage(self) -> Dict[str, Any]:
+        """Get current memory usage."""
+        try:
+            # Use /proc/meminfo on Linux - one read() gives a consistent snapshot
+            fd = os.open('/proc/meminfo', os.O_RDONLY)
+            try:
+                buf = os.read(fd, 8192)
+            finally:
+                os.close(fd)
             
-            for line in lines:
-                if line.startswith('MemTotal:'):
-                    mem_total = int(line.split()[1]) * 1024
-                elif line.startswith('MemAvailable:'):
-                    mem_available = int(line.split()[1]) * 1024
+            mem_total = _meminfo_field(buf, b'MemTotal:')
+            if b'MemAvailable:' in buf:
+                mem_available = _meminfo_field(buf, b'MemAvailable:')
+            else:
+                # Pre-3.14 kernels lack MemAvailable; approximate it
+                mem_available = (_meminfo_field(buf, b'MemFree:')
+                                 + _meminfo_field(buf, b'Buffers:')
+                                 + _meminfo_field(buf, b'\nCached:'))
             
             if mem_total > 0:
                 used = mem_total - mem_available
@@ -475,30 +862,29 @@ class SelfHealingEngine:
                     'total': mem_total,
                     'available': mem_available,
                     'used': used,
-                    'percent': percent
+                    'percent': percent,
+                    'status': self._bucket(percent, *self.MEMORY_THRESHOLDS)
                 }
         except Exception as e:
             logger.debug(f"[SelfHealingEngine] Memory check failed: {e}")
         
         return {'percent': 0}
     
-    def _get_disk_usage(self) -> Dict[str, float]:
+    def _get_disk_usage(self) -> Dict[str, Any]:
         """Get current disk usage."""
         try:
-            result = subprocess.run(
-                ['df', '-h', '.'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            # Parse df output
-            lines = result.stdout.strip().split('\n')
-            if len(lines) >= 2:
-                parts = lines[1].split()
-                if len(parts) >= 5:
-                    used_pct = int(parts[4].rstrip('%'))
-                    return {'percent': used_pct}
+            # statvfs on the data directory - no df subprocess to spawn and parse
+            usage = shutil.disk_usage(self._data_dir)
+            # Same basis as df: reserved root blocks count as neither used nor free
+            usable = usage.used + usage.free
+            percent = usage.used / usable * 100 if usable else 0
+            return {
+                'total': usage.total,
+                'free': usage.free,
+                'used': usage.used,
+                'percent': percent,
+                'status': self._bucket(percent, *self.DISK_THRESHOLDS)
+            }
         except Exception as e:
             logger.debug(f"[SelfHealingEngine] Disk check failed: {e}")
         
@@ -799,6 +1185,74 @@ Manual intervention may be required.
                            for k, v in self.last_check.items()}
         }
     
+    def get_fast_health_report(self, detailed: bool = False) -> Dict[str, Any]:
+        """
+        Get local resource health only (no network), cached for cheap polling.
+        
+        Args:
+            detailed: Include database integrity check and row counts
+        """
+        if detailed:
+            database = self._cached('database_detailed',
+                                    lambda: self._get_database_stats(detailed=True))
+        else:
+            database = self._cached('database', self._get_database_stats)
+        return {
+            'memory': self._cached('memory', self._get_memory_usage),
+            'disk': self._cached('disk', self._get_disk_usage),
+            'database': database,
+            'bot_process': self._cached('bot_process', self._get_bot_process_stats),
+            'timestamp': datetime.now(timezone.utc).isoformat()
+        }
+    
+    def get_health_report(self, detailed: bool = False) -> Dict[str, Any]:
+        """
+        Get local and exchange health.
+        
+        Never probes exchanges inline: results come from the background
+        refresh (or the monitoring loop), so 'exchanges' is empty until the
+        first round completes.
+        
+        Args:
+            detailed: Include database integrity check and row counts
+        """
+        self._start_exchange_refresh()
+        report = self.get_fast_health_report(detailed)
+        entry = self._cache.get('exchanges')
+        report['exchanges'] = entry[1] if entry else {}
+        report['exchanges_age_seconds'] = (
+            round(time.monotonic() - entry[0], 1) if entry else None
+        )
+        return report
+    
+    def _start_exchange_refresh(self):
+        """Start the background exchange refresh if it isn't running."""
+        with self._exchange_timer_lock:
+            if self._exchange_timer is None:
+                self._schedule_exchange_refresh(0)
+    
+    def _schedule_exchange_refresh(self, delay: float):
+        """Arm the refresh timer (caller holds _exchange_timer_lock)."""
+        timer = threading.Timer(delay, self._refresh_exchanges)
+        timer.daemon = True
+        self._exchange_timer = timer
+        timer.start()
+    
+    def _refresh_exchanges(self):
+        """Probe exchanges and re-arm the timer."""
+        entry = self._cache.get('exchanges')
+        # Skip the round if the monitoring loop refreshed recently
+        if not entry or time.monotonic() - entry[0] >= self.EXCHANGE_REFRESH_INTERVAL:
+            try:
+                self._cache['exchanges'] = (time.monotonic(), self._probe_exchanges())
+            except Exception as e:
+                logger.debug(f"[SelfHealingEngine] Exchange refresh failed: {e}")
+        
+        with self._exchange_timer_lock:
+            # stop() clears the timer; don't resurrect it
+            if self._exchange_timer is not None:
+                self._schedule_exchange_refresh(self.EXCHANGE_REFRESH_INTERVAL)
+    
     def get_active_issues(self) -> List[Dict]:
         """Get list of active issues."""
         return [asdict(issue) for issue in self.active_issues.values()]
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+News Fetcher Tests
+Run with: pytest tests/test_news_fetcher.py -v
+"""
+
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from news_fetcher import CryptoNewsFetcher
+
+
+class TestEstimateSentiment:
+    """Test suite for headline sentiment scoring."""
+    
+    @pytest.fixture
+    def fetcher(self):
+        return CryptoNewsFetcher()
+    
+    @pytest.mark.parametrize("headline", [
+        "Bitcoin surges past $100k",
+        "SOL rallies as ETF gets approved",
+    ])
+    def test_inflected_bullish(self, fetcher, headline):
+        """Test that inflected bullish verbs are counted."""
+        assert fetcher._estimate_sentiment(headline) > 0
+    
+    @pytest.mark.parametrize("headline", [
+        "ETH crashes overnight",
+        "Exchange falls after new regulation",
+    ])
+    def test_inflected_bearish(self, fetcher, headline):
+        """Test that inflected bearish verbs are counted."""
+        assert fetcher._estimate_sentiment(headline) < 0
+    
+    def test_substrings_do_not_match(self, fetcher):
+        """Test that terms only match whole words."""
+        assert fetcher._estimate_sentiment("Banking supply update") == 0.0
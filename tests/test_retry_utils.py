@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Retry Utilities Tests
+Run with: pytest tests/test_retry_utils.py -v
+"""
+
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import retry_utils
+from retry_utils import CircuitBreaker, TokenBucket, get_rate_limiter
+
+
+class FakeClock:
+    """Stand-in for the time module: sleep() advances the clock instantly."""
+    
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = 0.0
+    
+    def time(self):
+        return self.now
+    
+    def monotonic(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.now += seconds
+        self.slept += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Run retry_utils on a fake clock so timing tests can't flake under load."""
+    fake = FakeClock()
+    monkeypatch.setattr(retry_utils, "time", fake)
+    return fake
+
+
+class TestTokenBucket:
+    """Test suite for TokenBucket rate limiter."""
+    
+    def test_burst_within_capacity(self, clock):
+        """Test that a full bucket serves a burst without waiting."""
+        bucket = TokenBucket(rate=100.0, capacity=5)
+        for _ in range(5):
+            bucket.acquire()
+        assert clock.slept == 0.0
+    
+    def test_blocks_when_empty(self, clock):
+        """Test that an empty bucket waits for refill."""
+        # Power-of-two rate keeps the fake clock's arithmetic exact
+        bucket = TokenBucket(rate=64.0, capacity=1)
+        bucket.acquire()
+        bucket.acquire()
+        assert clock.slept == 1 / 64
+    
+    def test_shared_per_exchange(self):
+        """Test that limiters are shared process-wide per exchange."""
+        assert get_rate_limiter("binance") is get_rate_limiter("Binance")
+        assert get_rate_limiter("binance") is not get_rate_limiter("kraken")
+        assert get_rate_limiter("binance").rate == 20.0
+
+
+class TestCircuitBreaker:
+    """Test suite for CircuitBreaker."""
+    
+    def test_opens_after_threshold(self):
+        """Test breaker opens after repeated failures."""
+        cb = CircuitBreaker(failure_threshold=3, recovery_timeout=60.0)
+        for _ in range(3):
+            cb.record_failure()
+        assert cb.state == "OPEN"
+        assert cb.can_execute() is False
+    
+    def test_half_open_single_probe(self, clock):
+        """Test HALF_OPEN admits one probe per recovery window."""
+        cb = CircuitBreaker(failure_threshold=1, recovery_timeout=60.0, half_open_max_calls=1)
+        cb.record_failure()
+        clock.sleep(60.0)
+        
+        assert cb.can_execute() is True
+        assert cb.state == "HALF_OPEN"
+        assert cb.can_execute() is False
+        
+        # Probe never reported back: a new one is allowed after the window
+        clock.sleep(60.0)
+        assert cb.can_execute() is True
+        
+        cb.record_success()
+        assert cb.state == "CLOSED"
+    
+    def test_would_execute_does_not_claim_probe(self, clock):
+        """Test would_execute peeks without using the HALF_OPEN probe."""
+        cb = CircuitBreaker(failure_threshold=1, recovery_timeout=60.0, half_open_max_calls=1)
+        cb.record_failure()
+        assert cb.would_execute() is False
+        clock.sleep(60.0)
+        
+        assert cb.would_execute() is True
+        assert cb.state == "OPEN"
+        assert cb.can_execute() is True
+        assert cb.would_execute() is False
+    
+    def test_release_probe_returns_slot(self, clock):
+        """Test a released HALF_OPEN probe can be claimed again."""
+        cb = CircuitBreaker(failure_threshold=1, recovery_timeout=60.0, half_open_max_calls=1)
+        cb.record_failure()
+        clock.sleep(60.0)
+        
+        assert cb.can_execute() is True
+        assert cb.would_execute() is False
+        cb.release_probe()
+        assert cb.would_execute() is True
+        assert cb.can_execute() is True
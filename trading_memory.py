@@ -13,6 +13,7 @@ Features:
 
 import os
 import json
+import time
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
 
@@ -269,7 +270,7 @@ class TradingMemory:
             })
         
         # Keep only last 30 days (storage optimization)
-        cutoff = datetime.now(timezone.utc).timestamp() - (30 * 24 * 60 * 60)
+        cutoff = time.time() - (30 * 24 * 60 * 60)
         news = [n for n in news if datetime.fromisoformat(n["date"]).timestamp() > cutoff]
         
         with open(self.news_db, 'w') as f:
@@ -342,7 +343,7 @@ class TradingMemory:
         with open(self.news_db, 'r') as f:
             news = json.load(f)
         
-        cutoff = datetime.now(timezone.utc).timestamp() - (hours * 60 * 60)
+        cutoff = time.time() - (hours * 60 * 60)
         recent = [n for n in news if datetime.fromisoformat(n["date"]).timestamp() > cutoff]
         
         if keywords:
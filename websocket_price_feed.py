@@ -19,6 +19,19 @@ except ImportError:
     WEBSOCKET_AVAILABLE = False
     print("[WebSocketPriceFeed] websocket-client not installed. WebSocket features disabled.")
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = HAS_NUMPY
+except ImportError:
+    HAS_NUMBA = False
+
+import heapq
 import json
 import time
 import threading
@@ -31,6 +44,40 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+if HAS_NUMBA:
+    # No fastmath: it assumes no NaNs, and NaN marks a missing quote here
+    @njit(parallel=True, cache=True)
+    def _scan_spreads_kernel(bids, asks, min_spread_pct):
+        """Fused per-row best bid/ask, spread and threshold in one pass."""
+        n_rows, n_cols = bids.shape
+        bid_idx = np.empty(n_rows, dtype=np.int64)
+        ask_idx = np.empty(n_rows, dtype=np.int64)
+        spreads = np.empty(n_rows, dtype=np.float64)
+        hit = np.zeros(n_rows, dtype=np.bool_)
+        for i in prange(n_rows):
+            best_bid = np.nan
+            best_ask = np.nan
+            bi = -1
+            ai = -1
+            for j in range(n_cols):
+                b = bids[i, j]
+                a = asks[i, j]
+                if not np.isnan(b) and (bi < 0 or b > best_bid):
+                    best_bid = b
+                    bi = j
+                if not np.isnan(a) and (ai < 0 or a < best_ask):
+                    best_ask = a
+                    ai = j
+            bid_idx[i] = bi
+            ask_idx[i] = ai
+            if bi >= 0 and ai >= 0 and bi != ai and best_bid > 0 and best_ask > 0:
+                spreads[i] = (best_bid - best_ask) / best_ask * 100
+                hit[i] = spreads[i] >= min_spread_pct
+            else:
+                spreads[i] = np.nan
+        return bid_idx, ask_idx, spreads, hit
+
+
 @dataclass
 class PriceTick:
     """Single price tick from WebSocket."""
@@ -490,56 +537,110 @@ class WebSocketPriceFeed:
     
     def find_arbitrage_opportunities(
         self,
-        min_spread_pct: float = 0.1
+        min_spread_pct: float = 0.1,
+        top_k: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Find arbitrage opportunities between exchanges.
         
-        Returns list of opportunities with spread > min_spread_pct.
-        """
-        opportunities = []
+        Args:
+            min_spread_pct: Minimum spread percentage to report
+            top_k: Only return the k widest spreads (None for all)
         
+        Returns list of opportunities with spread > min_spread_pct,
+        widest first.
+        """
         with self._lock:
+            rows = []
             for symbol in self.symbols:
-                prices_for_symbol = {}
-                
-                for exchange in self.exchanges:
-                    tick = self.prices.get(exchange, {}).get(symbol)
-                    if tick:
-                        prices_for_symbol[exchange] = tick
-                
-                if len(prices_for_symbol) < 2:
+                ticks = [self.prices.get(exchange, {}).get(symbol) for exchange in self.exchanges]
+                if sum(tick is not None for tick in ticks) >= 2:
+                    rows.append((symbol, ticks))
+        
+        if not rows:
+            return []
+        
+        if HAS_NUMPY:
+            hits = self._scan_spreads_numpy(rows, min_spread_pct)
+        else:
+            hits = self._scan_spreads_python(rows, min_spread_pct)
+        
+        spread_of = lambda hit: hit[5]
+        if top_k is not None:
+            hits = heapq.nlargest(top_k, hits, key=spread_of)
+        else:
+            hits = sorted(hits, key=spread_of, reverse=True)
+        
+        timestamp = datetime.now(timezone.utc).isoformat()
+        return [
+            {
+                "symbol": symbol,
+                "buy_exchange": self.exchanges[ask_idx],
+                "sell_exchange": self.exchanges[bid_idx],
+                "buy_price": best_ask,
+                "sell_price": best_bid,
+                "spread_pct": spread_pct,
+                "timestamp": timestamp
+            }
+            for symbol, ask_idx, bid_idx, best_ask, best_bid, spread_pct in hits
+        ]
+    
+    @staticmethod
+    def _scan_spreads_numpy(rows: List[tuple], min_spread_pct: float) -> List[tuple]:
+        """Best bid/ask per symbol as one [symbols x exchanges] reduction."""
+        n_exchanges = len(rows[0][1])
+        bids = np.full((len(rows), n_exchanges), np.nan)
+        asks = np.full((len(rows), n_exchanges), np.nan)
+        for i, (_, ticks) in enumerate(rows):
+            for j, tick in enumerate(ticks):
+                if tick is not None:
+                    bids[i, j] = tick.bid
+                    asks[i, j] = tick.ask
+        
+        index = np.arange(len(rows))
+        if HAS_NUMBA:
+            bid_idx, ask_idx, spreads, mask = _scan_spreads_kernel(bids, asks, min_spread_pct)
+        else:
+            bid_idx = np.nanargmax(bids, axis=1)
+            ask_idx = np.nanargmin(asks, axis=1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                spreads = (bids[index, bid_idx] - asks[index, ask_idx]) / asks[index, ask_idx] * 100
+            mask = (bid_idx != ask_idx) & (bids[index, bid_idx] > 0) & \
+                (asks[index, ask_idx] > 0) & (spreads >= min_spread_pct)
+        best_bid = bids[index, bid_idx]
+        best_ask = asks[index, ask_idx]
+        
+        return [
+            (rows[i][0], int(ask_idx[i]), int(bid_idx[i]),
+             float(best_ask[i]), float(best_bid[i]), float(spreads[i]))
+            for i in np.flatnonzero(mask)
+        ]
+    
+    @staticmethod
+    def _scan_spreads_python(rows: List[tuple], min_spread_pct: float) -> List[tuple]:
+        """Pure-Python fallback for _scan_spreads_numpy."""
+        hits = []
+        for symbol, ticks in rows:
+            best_bid = None
+            best_ask = None
+            bid_idx = None
+            ask_idx = None
+            
+            for j, tick in enumerate(ticks):
+                if tick is None:
                     continue
-                
-                # Find best buy and sell prices
-                best_bid = None
-                best_ask = None
-                bid_exchange = None
-                ask_exchange = None
-                
-                for exchange, tick in prices_for_symbol.items():
-                    if best_bid is None or tick.bid > best_bid:
-                        best_bid = tick.bid
-                        bid_exchange = exchange
-                    if best_ask is None or tick.ask < best_ask:
-                        best_ask = tick.ask
-                        ask_exchange = exchange
-                
-                if best_bid and best_ask and bid_exchange != ask_exchange:
-                    spread_pct = (best_bid - best_ask) / best_ask * 100
-                    
-                    if spread_pct >= min_spread_pct:
-                        opportunities.append({
-                            "symbol": symbol,
-                            "buy_exchange": ask_exchange,
-                            "sell_exchange": bid_exchange,
-                            "buy_price": best_ask,
-                            "sell_price": best_bid,
-                            "spread_pct": spread_pct,
-                            "timestamp": datetime.now(timezone.utc).isoformat()
-                        })
-        
-        return sorted(opportunities, key=lambda x: x["spread_pct"], reverse=True)
+                if best_bid is None or tick.bid > best_bid:
+                    best_bid = tick.bid
+                    bid_idx = j
+                if best_ask is None or tick.ask < best_ask:
+                    best_ask = tick.ask
+                    ask_idx = j
+            
+            if best_bid and best_ask and bid_idx != ask_idx:
+                spread_pct = (best_bid - best_ask) / best_ask * 100
+                if spread_pct >= min_spread_pct:
+                    hits.append((symbol, ask_idx, bid_idx, best_ask, best_bid, spread_pct))
+        return hits
     
     def register_price_callback(self, callback: Callable[[PriceTick], None]):
         """Register a callback for price updates."""